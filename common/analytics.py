@@ -87,16 +87,32 @@ def log_ui_click(element_id: str, page_name: str, session_id: str = None, extras
         extra_data.update(extras)
     analytics_logger.info(f"UI Click: {element_id} on {page_name}", extra={'extra_data': extra_data})
 
-def log_model_call(model_name: str, status: str, duration_ms: float = 0, details: dict = None):
-    """Logs a generative model call event."""
+def current_call_context() -> dict:
+    """Returns the page and session of the current Mesop request.
+
+    Capture this on the request thread before handing work to another thread,
+    and pass it to track_model_call, so those calls are still attributed.
+    """
     try:
         state = me.state(AppState)
-        page_name = state.current_page
-        session_id = state.session_id
+        return {"page_name": state.current_page, "session_id": state.session_id}
     except Exception:
         # Handle cases where me.state is called outside of context (e.g. threads)
-        page_name = "unknown"
-        session_id = "unknown"
+        return {"page_name": "unknown", "session_id": "unknown"}
+
+def log_model_call(
+    model_name: str,
+    status: str,
+    duration_ms: float = 0,
+    details: dict = None,
+    page_name: str = None,
+    session_id: str = None,
+):
+    """Logs a generative model call event."""
+    if page_name is None or session_id is None:
+        context = current_call_context()
+        page_name = page_name or context["page_name"]
+        session_id = session_id or context["session_id"]
 
     extra_data = {
         "event_type": "model_call",
@@ -125,14 +141,19 @@ def track_click(element_id: str):
     return decorator
 
 @contextmanager
-def track_model_call(model_name: str, **kwargs):
-    """Context manager to log the duration and status of a model call."""
+def track_model_call(model_name: str, page_name: str = None, session_id: str = None, **kwargs):
+    """Context manager to log the duration and status of a model call.
+
+    page_name and session_id default to the current Mesop request's; pass
+    them explicitly (see current_call_context) when tracking from another thread.
+    """
     start_time = time.time()
+    context = {"page_name": page_name, "session_id": session_id}
     try:
         yield
         duration_ms = (time.time() - start_time) * 1000
-        log_model_call(model_name, status="success", duration_ms=duration_ms, details=kwargs)
+        log_model_call(model_name, status="success", duration_ms=duration_ms, details=kwargs, **context)
     except Exception as e:
         duration_ms = (time.time() - start_time) * 1000
-        log_model_call(model_name, status="failure", duration_ms=duration_ms, details={"error": str(e), **kwargs})
+        log_model_call(model_name, status="failure", duration_ms=duration_ms, details={"error": str(e), **kwargs}, **context)
         raise # Re-raise the exception after logging
@@ -40,7 +40,7 @@ def create_display_url(gcs_uri: str) -> str:
     if not gcs_uri or not gcs_uri.startswith("gs://"):
         return ""
 
-    if cfg().USE_MEDIA_PROXY:
+    if cfg.USE_MEDIA_PROXY:
         # Use the fast, simple proxy URL
         proxy_path = gcs_uri.replace("gs://", "")
         return f"/media/{proxy_path}"
@@ -0,0 +1,67 @@
+/**
+ * Copyright 2025 Google LLC
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { LitElement } from "https://cdn.jsdelivr.net/npm/lit/+esm";
+
+class IntervalTimer extends LitElement {
+  static get properties() {
+    return {
+      intervalMs: { type: Number },
+      tick: { type: String }, // Event handler ID
+    };
+  }
+
+  constructor() {
+    super();
+    this.intervalMs = 500;
+    this.tick = "";
+    this.timer = null;
+  }
+
+  connectedCallback() {
+    super.connectedCallback();
+    this.startTimer();
+  }
+
+  disconnectedCallback() {
+    super.disconnectedCallback();
+    this.stopTimer();
+  }
+
+  updated(changedProperties) {
+    if (changedProperties.has("intervalMs")) {
+      this.startTimer();
+    }
+  }
+
+  startTimer() {
+    this.stopTimer();
+    this.timer = setInterval(() => {
+      if (this.tick) {
+        this.dispatchEvent(new MesopEvent(this.tick, {}));
+      }
+    }, this.intervalMs);
+  }
+
+  stopTimer() {
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+  }
+}
+
+customElements.define("interval-timer", IntervalTimer);
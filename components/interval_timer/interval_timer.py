@@ -0,0 +1,43 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Python wrapper for the Interval Timer Lit component."""
+
+import typing
+
+import mesop as me
+
+
+@me.web_component(path="./interval_timer.js")
+def interval_timer(
+    *,
+    on_tick: typing.Callable[[me.WebEvent], None],
+    interval_ms: int = 500,
+    key: str | None = None,
+):
+    """An invisible element that fires on_tick every interval_ms while rendered.
+
+    Render it only while there is background work to pick up, so the page
+    stops polling once that work is done.
+    """
+    return me.insert_web_component(
+        key=key,
+        name="interval-timer",
+        properties={
+            "intervalMs": interval_ms,
+        },
+        events={
+            "tick": on_tick,
+        },
+    )
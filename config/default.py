@@ -82,6 +82,45 @@ class Default:
     GEMINI_WRITERS_WORKSHOP_MODEL_ID: str = os.environ.get(
         "GEMINI_WRITERS_WORKSHOP_MODEL_ID", MODEL_ID
     )
+    # Thinking budgets (tokens) for structured image critique / description tasks
+    GEMINI_CRITIC_THINKING_BUDGET: int = int(
+        os.environ.get("GEMINI_CRITIC_THINKING_BUDGET", 2048)
+    )
+    GEMINI_DESCRIPTION_THINKING_BUDGET: int = int(
+        os.environ.get("GEMINI_DESCRIPTION_THINKING_BUDGET", 0)
+    )
+    # Maximum number of concurrent in-flight Gemini requests per fan-out
+    GEMINI_MAX_CONCURRENCY: int = int(os.environ.get("GEMINI_MAX_CONCURRENCY", 5))
+    # Size of the shared HTTP/2 connection pool used by async Gemini calls
+    GEMINI_MAX_CONNECTIONS: int = int(os.environ.get("GEMINI_MAX_CONNECTIONS", 64))
+
+    # Gemini response cache (exact-match, deterministic calls only)
+    GEMINI_RESPONSE_CACHE_SIZE: int = int(
+        os.environ.get("GEMINI_RESPONSE_CACHE_SIZE", 512)
+    )
+    GEMINI_RESPONSE_CACHE_MAX_TEMPERATURE: float = float(
+        os.environ.get("GEMINI_RESPONSE_CACHE_MAX_TEMPERATURE", 0.3)
+    )
+    GEMINI_RESPONSE_CACHE_REDIS_URL: Optional[str] = os.environ.get(
+        "GEMINI_RESPONSE_CACHE_REDIS_URL"
+    )
+    # Semantic cache for near-duplicate rewriter / critique / question prompts (opt-in)
+    GEMINI_SEMANTIC_CACHE_ENABLED: bool = (
+        os.environ.get("GEMINI_SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    )
+    GEMINI_SEMANTIC_CACHE_THRESHOLD: float = float(
+        os.environ.get("GEMINI_SEMANTIC_CACHE_THRESHOLD", 0.92)
+    )
+    GEMINI_EMBEDDING_MODEL_ID: str = os.environ.get(
+        "GEMINI_EMBEDDING_MODEL_ID", "text-embedding-004"
+    )
+    # Explicit Gemini context caching for large static prompts (opt-in)
+    GEMINI_CONTEXT_CACHE_ENABLED: bool = (
+        os.environ.get("GEMINI_CONTEXT_CACHE_ENABLED", "false").lower() == "true"
+    )
+    GEMINI_CONTEXT_CACHE_TTL_SECONDS: int = int(
+        os.environ.get("GEMINI_CONTEXT_CACHE_TTL_SECONDS", 3600)
+    )
 
     # Collections
     GENMEDIA_FIREBASE_DB: str = os.environ.get("GENMEDIA_FIREBASE_DB", "(default)")
@@ -32,8 +32,7 @@ from common.storage import download_from_gcs, store_to_gcs
 from config.default import Default
 
 from models.gemini import (
-    get_facial_composite_profile,
-    get_natural_language_description,
+    get_profiles_and_descriptions,
     generate_final_scene_prompt,
     select_best_image,
     generate_image_from_prompt_and_images,
@@ -91,10 +90,10 @@ def generate_character_video(
         duration_seconds=0,
         data={},
     )
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        profiles = list(executor.map(get_facial_composite_profile, reference_image_bytes_list))
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        all_descriptions = list(executor.map(get_natural_language_description, profiles))
+    all_descriptions = [
+        description
+        for _, description in get_profiles_and_descriptions(reference_image_bytes_list)
+    ]
     character_description = all_descriptions[0]
     step_duration = time.time() - step_start_time
     yield WorkflowStepResult(
@@ -176,7 +175,7 @@ def generate_character_video(
         data={},
     )
     best_image_selection = select_best_image(
-        reference_image_bytes_list, candidate_image_bytes_list, candidate_image_gcs_uris
+        reference_image_gcs_uris, candidate_image_bytes_list, candidate_image_gcs_uris
     )
     best_image_gcs_uri = best_image_selection.best_image_path
     step_duration = time.time() - step_start_time
@@ -29,6 +29,11 @@ class FacialCompositeProfile(BaseModel):
     jawline: str = Field(..., description="The definition of the jawline (e.g., sharp, soft).")
     distinguishing_marks: Optional[List[str]] = Field(None, description="Any distinguishing marks like scars, moles, or tattoos.")
 
+class FacialProfileWithDescription(BaseModel):
+    """A facial profile together with its natural language description."""
+    profile: FacialCompositeProfile
+    natural_language_description: str = Field(..., description="A concise, natural language description of the person's key physical traits, suitable for an image generation model.")
+
 class GeneratedPrompts(BaseModel):
     """Holds the generated positive and negative prompts for image generation."""
     prompt: str = Field(..., description="The detailed, final prompt for the image generation model.")
@@ -13,38 +13,60 @@
 # limitations under the License.
 """Gemini methods"""
 
-import json
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import hashlib
+import io
+import os
+import threading
 import time
 import uuid
+import warnings
+import weakref
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Any, Dict, Iterator, Optional, Union
 
+import httpx
 import requests
-from google.cloud.aiplatform import telemetry
+from google.api_core import exceptions as api_exceptions
+from google.genai import errors as genai_errors
 from google.genai import types
+from PIL import Image
 from pydantic import BaseModel, Field
+from pydantic_core import from_json
 from tenacity import (
+    RetryCallState,
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
-from common.analytics import analytics_logger, track_model_call
+from common.analytics import (
+    analytics_logger,
+    current_call_context,
+    track_model_call,
+)
 from common.error_handling import GenerationError
 from common.storage import store_to_gcs
 from config.default import Default  # Import Default for cfg
 from config.evaluators import GEMINI_TTS_EVALUATOR
 from config.rewriters import MAGAZINE_EDITOR_PROMPT, REWRITER_PROMPT
+from models import llm_cache
 from models.character_consistency_models import (
     BestImage,
     FacialCompositeProfile,
+    FacialProfileWithDescription,
     GeneratedPrompts,
 )
 from models.model_setup import (
     GeminiModelSetup,
 )
+from models.semantic_cache import SemanticCache
 from models.shop_the_look_models import (
+    ArticleDescription,
     ArticleDescriptionWrapper,
     BestImageAccuracy,
     CatalogRecord,
@@ -85,10 +107,434 @@ class RoomList(BaseModel):
     )
 
 
-# Initialize client and default model ID for rewriter
-client = GeminiModelSetup.init()
+# Response schemas are static; build them once at import rather than per call.
+_ROOM_LIST_SCHEMA = RoomList.model_json_schema()
+_PROFILE_AND_DESCRIPTION_SCHEMA = FacialProfileWithDescription.model_json_schema()
+_GENERATED_PROMPTS_SCHEMA = GeneratedPrompts.model_json_schema()
+_BEST_IMAGE_SCHEMA = BestImage.model_json_schema()
+_BEST_IMAGE_ACCURACY_SCHEMA = BestImageAccuracy.model_json_schema()
+_GENERATED_IMAGE_ACCURACY_SCHEMA = GeneratedImageAccuracyWrapper.model_json_schema()
+_ARTICLE_DESCRIPTION_SCHEMA = ArticleDescriptionWrapper.model_json_schema()
+_TRANSFORMATION_PROMPTS_SCHEMA = TransformationPrompts.model_json_schema()
+
+
+_DEFAULT_SAFETY_SETTINGS = [
+    types.SafetySetting(
+        category=category,
+        threshold=types.HarmBlockThreshold.BLOCK_NONE,
+    )
+    for category in (
+        types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
+        types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
+        types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
+        types.HarmCategory.HARM_CATEGORY_HARASSMENT,
+    )
+]
+
+_AUDIO_ANALYSIS_SYSTEM_INSTRUCTION = """You're a music producer and critic with a keen ear for describing musical qualities and soundscapes. If you're given audio, describe it. If you're given an idea or a scenario, describe the music that would represent that. Aim for a single paragraph description of musical direction and optionally any explanation of your direction. As a rule, don't refer to any particular artist, but instead describe their style."""
+
+_AUDIO_ANALYSIS_TEMPLATE = """Describe this musical clip ("audio-analysis"), then suggest a list of genres and qualities.
+
+The original prompt was the following:
+
+"{prompt}"
+
+Then, review the original prompt with your description.
+
+Output this as JSON.
+
+"""
+_AUDIO_ANALYSIS_SCHEMA = {
+    # "$schema": "http://json-schema.org/draft-07/schema#", # Schema for schema, optional here
+    "title": "Music Analysis and Alignment Response",
+    "description": "Schema for describing audio analysis, suggested genres/qualities, and alignment with an initial prompt.",
+    "type": "OBJECT",
+    "properties": {
+        "audio-analysis": {
+            "description": "A single-paragraph description of the provided audio or suggested musical direction.",
+            "type": "STRING",
+        },
+        "genre-quality": {
+            "description": "A list of suggested genres and descriptive musical qualities.",
+            "type": "ARRAY",
+            "items": {"type": "STRING"},
+            "minItems": 1,
+        },
+        "prompt-alignment": {
+            "description": "An evaluation of how well the audio or generated description aligns with the original prompt's requirements.",
+            "type": "STRING",
+        },
+    },
+    "required": ["audio-analysis", "genre-quality", "prompt-alignment"],
+    # "additionalProperties": False, # This can be strict; ensure model adheres or remove
+}
+
+
 cfg = Default()  # Instantiate config
+
+
+def _http_options(base_url: Optional[str] = None) -> dict:
+    """HTTP options shared by the Gemini clients created in this module.
+
+    The async transport speaks HTTP/2 so concurrent `client.aio` calls
+    multiplex over a bounded pool of connections instead of opening one each.
+    """
+    http_options = {
+        "async_client_args": {
+            "http2": True,
+            "limits": httpx.Limits(max_connections=cfg.GEMINI_MAX_CONNECTIONS),
+        }
+    }
+    if base_url:
+        http_options["base_url"] = base_url
+    return http_options
+
+
+# Initialize client and default model ID for rewriter
+client = GeminiModelSetup.init(http_options=_http_options())
+# Async facade over the same client; all a* functions below issue through it.
+async_client = client.aio
 REWRITER_MODEL_ID = cfg.MODEL_ID  # Use default model from config for rewriter
+response_cache = llm_cache.create_cache_backend(
+    maxsize=cfg.GEMINI_RESPONSE_CACHE_SIZE,
+    redis_url=cfg.GEMINI_RESPONSE_CACHE_REDIS_URL,
+)
+
+
+# Transient failures worth retrying: rate limiting (429), transient server
+# errors (500), unavailability (503), timeouts (504) and network errors.
+# Anything else, such as auth or request validation errors, fails fast.
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 503, 504})
+_RETRYABLE_EXCEPTIONS = (
+    api_exceptions.ResourceExhausted,
+    api_exceptions.InternalServerError,
+    api_exceptions.ServiceUnavailable,
+    api_exceptions.DeadlineExceeded,
+    requests.exceptions.ConnectionError,
+    httpx.TransportError,
+    ConnectionError,
+    TimeoutError,
+)
+_MAX_RETRY_AFTER_SECONDS = 60
+_jittered_backoff = wait_random_exponential(multiplier=1, max=30)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, genai_errors.APIError):
+        return exc.code in _RETRYABLE_STATUS_CODES
+    return isinstance(exc, _RETRYABLE_EXCEPTIONS)
+
+
+def _retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Returns the delay from a Retry-After header on the error, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    value = headers.get("Retry-After") if headers else None
+    try:
+        return float(value) if value else None
+    except (TypeError, ValueError):  # HTTP-date form; fall back to backoff
+        return None
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Honors Retry-After on rate-limit errors, else jittered exponential backoff."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    retry_after = _retry_after_seconds(exc) if exc else None
+    if retry_after is not None:
+        return min(retry_after, _MAX_RETRY_AFTER_SECONDS)
+    return _jittered_backoff(retry_state)
+
+
+# Retry policy shared by every Gemini call in this module: up to 3 attempts on
+# transient errors, honoring Retry-After.
+_gemini_retry = retry(
+    wait=_retry_wait,
+    stop=stop_after_attempt(3),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
+)
+
+
+def _cache_lookup(
+    model_name: str, contents: Any, config: types.GenerateContentConfig, task: str
+) -> tuple[Optional[str], Optional[str]]:
+    """Returns (cache_key, cached_text); the key is None for uncacheable configs."""
+    if not llm_cache.is_cacheable(config, cfg.GEMINI_RESPONSE_CACHE_MAX_TEMPERATURE):
+        return None, None
+    key = llm_cache.cache_key(model_name, contents, config)
+    hit = response_cache.get(key)
+    if hit is not None:
+        analytics_logger.info(f"Response cache hit for {task}")
+    return key, hit
+
+
+def _cache_store(key: Optional[str], text: Optional[str]) -> None:
+    if key and text:
+        response_cache.set(key, text, ttl=llm_cache.DEFAULT_TTL_SECONDS)
+
+
+def _generate_content_text(
+    model_name: str,
+    contents: Any,
+    config: types.GenerateContentConfig,
+    task: str,
+) -> str:
+    """Calls generate_content and returns the response text.
+
+    Low-temperature requests are served from the response cache when an
+    identical request (model, contents, config) has been answered before.
+    """
+    key, hit = _cache_lookup(model_name, contents, config, task)
+    if hit is not None:
+        return hit
+
+    with track_model_call(model_name=model_name, task=task):
+        response = client.models.generate_content(
+            model=model_name, contents=contents, config=config
+        )
+
+    _cache_store(key, response.text)
+    return response.text
+
+
+def _stream_content_text(
+    model_name: str,
+    contents: Any,
+    config: types.GenerateContentConfig,
+    task: str,
+) -> Iterator[str]:
+    """Calls generate_content_stream and yields text chunks as they arrive."""
+    with track_model_call(model_name=model_name, task=task):
+        for chunk in client.models.generate_content_stream(
+            model=model_name, contents=contents, config=config
+        ):
+            if chunk.text:
+                yield chunk.text
+
+
+# Gemini context caches for static prompt prefixes, created lazily per process.
+_context_caches: dict[tuple[str, str], tuple[Optional[str], float]] = {}
+_context_caches_lock = threading.Lock()
+
+
+def _get_context_cache(model_name: str, static_prompt: str) -> Optional[str]:
+    """Returns the name of a Gemini context cache holding `static_prompt`.
+
+    The cache is created on first use and recreated shortly before its TTL
+    runs out. Returns None when context caching is disabled or the cache
+    cannot be created (for example, when the prompt is below the model's
+    minimum cacheable size), in which case callers send the prompt inline.
+    """
+    if not cfg.GEMINI_CONTEXT_CACHE_ENABLED:
+        return None
+    key = (model_name, hashlib.sha256(static_prompt.encode("utf-8")).hexdigest())
+    ttl = cfg.GEMINI_CONTEXT_CACHE_TTL_SECONDS
+    with _context_caches_lock:
+        now = time.monotonic()
+        entry = _context_caches.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        try:
+            cached_content = client.caches.create(
+                model=model_name,
+                config=types.CreateCachedContentConfig(
+                    contents=[
+                        types.Content(
+                            role="user",
+                            parts=[types.Part.from_text(text=static_prompt)],
+                        )
+                    ],
+                    ttl=f"{ttl}s",
+                ),
+            )
+            name = cached_content.name
+            # Refresh a minute early so requests never reference an expired cache.
+            expires_at = now + max(ttl - 60, 0)
+            analytics_logger.info(f"Created Gemini context cache {name}")
+        except Exception as e:
+            analytics_logger.warning(
+                f"Context cache creation failed for {model_name}, sending prompt inline: {e}"
+            )
+            # Remember the failure so every call does not retry creation.
+            name, expires_at = None, now + ttl
+        _context_caches[key] = (name, expires_at)
+        return name
+
+
+# Async support. Sync wrappers run their async twins on one long-lived event
+# loop so the google-genai async client (and its connection pool) is never
+# reused across closed loops.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_semaphores = weakref.WeakKeyDictionary()  # event loop -> asyncio.Semaphore
+_in_flight = weakref.WeakKeyDictionary()  # event loop -> {cache key: Future}
+# Set by _submit_fan_out for each submitted call: its concurrency limit and
+# the page/session captured on the calling thread, for track_model_call.
+_fan_out_semaphore: contextvars.ContextVar[Optional[asyncio.Semaphore]] = (
+    contextvars.ContextVar("gemini_fan_out_semaphore", default=None)
+)
+_call_context: contextvars.ContextVar[dict] = contextvars.ContextVar(
+    "gemini_call_context", default={}
+)
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="gemini-aio", daemon=True
+            ).start()
+    return _loop
+
+
+def _submit_fan_out(coros) -> list[concurrent.futures.Future]:
+    """Schedules coroutines on the shared Gemini event loop as one fan-out.
+
+    The fan-out gets its own GEMINI_MAX_CONCURRENCY limit, so one session's
+    batch never queues another's, and model calls are attributed to the
+    caller's page and session rather than to the loop thread.
+    """
+    semaphore = asyncio.Semaphore(cfg.GEMINI_MAX_CONCURRENCY)
+    call_context = current_call_context()
+
+    async def _run(coro):
+        _fan_out_semaphore.set(semaphore)
+        _call_context.set(call_context)
+        return await coro
+
+    loop = _background_loop()
+    return [asyncio.run_coroutine_threadsafe(_run(coro), loop) for coro in coros]
+
+
+def run_sync(coro):
+    """Runs a coroutine on the shared Gemini event loop and waits for it."""
+    return _submit_fan_out([coro])[0].result()
+
+
+def _concurrency_semaphore() -> asyncio.Semaphore:
+    """Returns the concurrency limiter for the current fan-out.
+
+    Outside run_sync (a coroutine awaited on the caller's own loop), falls
+    back to one limiter per event loop.
+    """
+    semaphore = _fan_out_semaphore.get()
+    if semaphore is not None:
+        return semaphore
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(cfg.GEMINI_MAX_CONCURRENCY)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+async def agenerate_content(
+    model_name: str,
+    contents: Any,
+    config: Optional[types.GenerateContentConfig] = None,
+    task: str = "generate_content",
+    gemini_client=None,
+    **track_kwargs,
+) -> types.GenerateContentResponse:
+    """Async generate_content, limited to GEMINI_MAX_CONCURRENCY in-flight calls."""
+    aio = gemini_client.aio if gemini_client else async_client
+    async with _concurrency_semaphore():
+        with track_model_call(
+            model_name=model_name, task=task, **_call_context.get(), **track_kwargs
+        ):
+            return await aio.models.generate_content(
+                model=model_name, contents=contents, config=config
+            )
+
+
+async def _agenerate_content_text(
+    model_name: str,
+    contents: Any,
+    config: types.GenerateContentConfig,
+    task: str,
+) -> str:
+    """Async counterpart of _generate_content_text.
+
+    Concurrent identical cacheable requests are coalesced: the first caller
+    issues the request and the others await its result, so a burst of
+    duplicates costs one call instead of racing to fill the cache.
+    """
+    key, hit = _cache_lookup(model_name, contents, config, task)
+    if hit is not None:
+        return hit
+    if key is None:
+        response = await agenerate_content(model_name, contents, config, task=task)
+        return response.text
+
+    loop = asyncio.get_running_loop()
+    in_flight = _in_flight.setdefault(loop, {})
+    pending = in_flight.get(key)
+    if pending is not None:
+        analytics_logger.info(f"Coalesced in-flight Gemini request for {task}")
+        return await asyncio.shield(pending)
+
+    future = loop.create_future()
+    in_flight[key] = future
+    try:
+        response = await agenerate_content(model_name, contents, config, task=task)
+        _cache_store(key, response.text)
+        future.set_result(response.text)
+        return response.text
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved; there may be no other waiters
+        raise
+    finally:
+        del in_flight[key]
+
+
+def _embed_texts(texts: list[str]) -> list[list[float]]:
+    """Embeds a batch of texts with the configured embedding model."""
+    response = client.models.embed_content(
+        model=cfg.GEMINI_EMBEDDING_MODEL_ID, contents=texts
+    )
+    return [embedding.values for embedding in response.embeddings]
+
+
+semantic_cache = (
+    SemanticCache(_embed_texts, threshold=cfg.GEMINI_SEMANTIC_CACHE_THRESHOLD)
+    if cfg.GEMINI_SEMANTIC_CACHE_ENABLED
+    else None
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(location: str, base_url: Optional[str] = None):
+    """Returns a Gemini client per (location, base_url), created once.
+
+    Reusing the client keeps its pooled HTTP connections and credentials warm
+    instead of paying a TLS handshake and token refresh on every call.
+    """
+    return GeminiModelSetup.init(
+        location=location, http_options=_http_options(base_url)
+    )
+
+
+async def _agenerate_candidates(
+    gemini_client,
+    model_name: str,
+    contents: Any,
+    config: types.GenerateContentConfig,
+    count: int,
+) -> list[types.GenerateContentResponse]:
+    """Issues `count` identical requests concurrently."""
+
+    async def _one() -> types.GenerateContentResponse:
+        async with _concurrency_semaphore():
+            return await gemini_client.aio.models.generate_content(
+                model=model_name, contents=contents, config=config
+            )
+
+    return await asyncio.gather(*(_one() for _ in range(count)))
 
 
 def generate_image_from_prompt_and_images(
@@ -102,23 +548,23 @@ def generate_image_from_prompt_and_images(
     use_search: bool = False,
 ) -> tuple[list[str], float, list[str], Optional[Dict[str, Any]]]:
     """Generates images from a prompt and a list of images."""
-    start_time = time.time()
+    start_time = time.perf_counter()
     model_name = cfg.GEMINI_IMAGE_GEN_MODEL
 
+    unique_images = list(dict.fromkeys(images))  # Order-preserving dedupe
+    if len(unique_images) < len(images):
+        analytics_logger.info(
+            f"Dropped {len(images) - len(unique_images)} duplicate input image(s)."
+        )
+    images = unique_images
+
     parts = [types.Part.from_text(text=prompt)]
     for image_uri in images:
         parts.append(types.Part.from_uri(file_uri=image_uri, mime_type="image/png"))
 
     contents = [types.Content(role="user", parts=parts)]
 
-    http_options = None
-    if cfg.GEMINI_IMAGE_GEN_API_BASE_URL:
-        http_options = {"base_url": cfg.GEMINI_IMAGE_GEN_API_BASE_URL}
-
-    client = GeminiModelSetup.init(
-        location=cfg.GEMINI_IMAGE_GEN_LOCATION,
-        http_options=http_options,
-    )
+    client = _get_client(cfg.GEMINI_IMAGE_GEN_LOCATION, cfg.GEMINI_IMAGE_GEN_API_BASE_URL)
 
     analytics_logger.info(
         f"Generating image with model: {model_name}, aspect_ratio: {aspect_ratio}, num_images: {len(images)}, image_size: {image_size}, use_search: {use_search}"
@@ -134,33 +580,48 @@ def generate_image_from_prompt_and_images(
     if use_search:
         tools.append(types.Tool(google_search=types.GoogleSearch()))
 
+    config = types.GenerateContentConfig(
+        response_modalities=["IMAGE", "TEXT"],
+        image_config=types.ImageConfig(**image_config_args),
+        tools=tools if tools else None,
+    )
+
     with track_model_call(
         model_name=model_name,
         aspect_ratio=aspect_ratio,
         num_images=len(images),
     ):
-        response = client.models.generate_content(
-            model=model_name,
-            contents=contents,
-            config=types.GenerateContentConfig(
-                response_modalities=["IMAGE", "TEXT"],
-                image_config=types.ImageConfig(**image_config_args),
-                tools=tools if tools else None,
-                # candidate_count=candidate_count,
-            ),
-        )
+        if candidate_count > 1:
+            # The image model returns a single candidate per request, so fan
+            # out one request per candidate instead.
+            responses = run_sync(
+                _agenerate_candidates(
+                    client, model_name, contents, config, candidate_count
+                )
+            )
+        else:
+            responses = [
+                client.models.generate_content(
+                    model=model_name,
+                    contents=contents,
+                    config=config,
+                )
+            ]
 
-    end_time = time.time()
-    execution_time = end_time - start_time
+    execution_time = time.perf_counter() - start_time
 
     gcs_uris = []
     captions = []
-    current_text_buffer = ""
     grounding_info = None
 
-    if response.candidates:
-        candidate = response.candidates[0]
-        if candidate.grounding_metadata:
+    candidates = [response.candidates[0] for response in responses if response.candidates]
+    # Local alias keeps the attribute lookup out of the per-part loop.
+    uuid4 = uuid.uuid4
+    # (file_name, mime_type, data) for each image part, uploaded after parsing.
+    pending_uploads = []
+    for candidate in candidates:
+        current_text_buffer = ""
+        if candidate.grounding_metadata and grounding_info is None:
             try:
                 # google-genai types usually have model_dump()
                 grounding_info = candidate.grounding_metadata.model_dump()
@@ -172,50 +633,55 @@ def generate_image_from_prompt_and_images(
                 f"generate_image_from_prompt_and_images: {len(candidate.content.parts)} parts"
             )
             for i, part in enumerate(candidate.content.parts):
-                if hasattr(part, "text") and part.text:
+                text = getattr(part, "text", None)
+                if text:
                     analytics_logger.info(
-                        f"generate_image_from_prompt_and_images (text): {part.text}"
+                        f"generate_image_from_prompt_and_images (text): {text}"
                     )
-                    current_text_buffer += part.text
-                
-                if hasattr(part, "inline_data") and part.inline_data:
+                    current_text_buffer += text
+
+                inline = getattr(part, "inline_data", None)
+                if inline and inline.data:
                     # Default to "image/png" if mime_type is missing
-                    mime_type = "image/png"
-                    if (
-                        hasattr(part.inline_data, "mime_type")
-                        and part.inline_data.mime_type
-                    ):
-                        mime_type = part.inline_data.mime_type
-                    gcs_uri = store_to_gcs(
-                        folder=gcs_folder,
-                        file_name=f"{file_prefix}_{uuid.uuid4()}_{i}.png",
-                        mime_type=mime_type,
-                        contents=part.inline_data.data,
+                    mime_type = inline.mime_type or "image/png"
+                    pending_uploads.append(
+                        (f"{file_prefix}_{uuid4()}_{i}.png", mime_type, inline.data)
                     )
-                    gcs_uris.append(gcs_uri)
                     captions.append(current_text_buffer.strip())
                     current_text_buffer = "" # Reset buffer after associating with an image
-    else:
+    if not candidates:
         analytics_logger.warning("generate_image_from_prompt_and_images: no images")
+
+    if pending_uploads:
+        # GCS uploads are I/O-bound; map() keeps URIs aligned with captions.
+        def _upload(pending: tuple[str, str, bytes]) -> str:
+            file_name, mime_type, data = pending
+            return store_to_gcs(
+                folder=gcs_folder,
+                file_name=file_name,
+                mime_type=mime_type,
+                contents=data,
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, len(pending_uploads))
+        ) as executor:
+            gcs_uris = list(executor.map(_upload, pending_uploads))
     return gcs_uris, execution_time, captions, grounding_info
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
+_ROOM_NAMES_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=_ROOM_LIST_SCHEMA,
+    temperature=0.1,  # Low temperature for factual extraction
 )
+
+
+@_gemini_retry
 def extract_room_names_from_image(image_uri: str) -> list[str]:
     """Analyzes a floor plan image and extracts the names of the rooms."""
     model_name = cfg.MODEL_ID  # Use a fast model for this analysis task
 
-    config = types.GenerateContentConfig(
-        response_mime_type="application/json",
-        response_schema=RoomList.model_json_schema(),
-        temperature=0.1,  # Low temperature for factual extraction
-    )
-
     prompt_text = "Analyze this floor plan image and identify all the labeled rooms. Return a JSON list of the room names."
 
     prompt_parts = [
@@ -223,24 +689,43 @@ def extract_room_names_from_image(image_uri: str) -> list[str]:
         types.Part.from_uri(file_uri=image_uri, mime_type="image/png"),
     ]
 
-    with track_model_call(model_name=model_name, task="extract_room_names"):
-        response = client.models.generate_content(
-            model=model_name, contents=prompt_parts, config=config
-        )
-
-    room_list_obj = RoomList.model_validate_json(response.text)
+    response_text = _generate_content_text(
+        model_name, prompt_parts, _ROOM_NAMES_CONFIG, task="extract_room_names"
+    )
 
-    return [room.room_name for room in room_list_obj.rooms]
+    # The response schema already enforces the RoomList shape, so read the
+    # one field needed directly instead of building the pydantic objects.
+    return [room["room_name"] for room in from_json(response_text)["rooms"]]
 
 
-@retry(
-    wait=wait_exponential(
-        multiplier=1, min=1, max=10
-    ),  # Exponential backoff (1s, 2s, 4s... up to 10s)
-    stop=stop_after_attempt(3),  # Stop after 3 attempts
-    retry=retry_if_exception_type(Exception),  # Retry on all exceptions for robustness
-    reraise=True,  # re-raise the last exception if all retries fail
+_REWRITER_CONFIG = types.GenerateContentConfig(
+    response_modalities=["TEXT"],
 )
+
+
+def rewriter_stream(original_prompt: str, rewriter_prompt: str) -> Iterator[str]:
+    """Streams the rewritten prompt text chunk by chunk.
+
+    Not retried: a partially consumed stream cannot be replayed. Use
+    `rewriter` when the complete text is needed.
+    """
+    cache_name = _get_context_cache(REWRITER_MODEL_ID, rewriter_prompt)
+    if cache_name:
+        # The rewriter instructions are already in the context cache.
+        contents = original_prompt
+        config = _REWRITER_CONFIG.model_copy(update={"cached_content": cache_name})
+    else:
+        contents = f"{rewriter_prompt} {original_prompt}"
+        config = _REWRITER_CONFIG
+    return _stream_content_text(
+        REWRITER_MODEL_ID,  # Explicitly use the configured model
+        contents,
+        config,
+        task="rewriter",
+    )
+
+
+@_gemini_retry
 def rewriter(original_prompt: str, rewriter_prompt: str) -> str:
     """A Gemini rewriter.
 
@@ -254,28 +739,44 @@ def rewriter(original_prompt: str, rewriter_prompt: str) -> str:
 
     full_prompt = f"{rewriter_prompt} {original_prompt}"
     analytics_logger.info(f"Rewriter: '{full_prompt}' with model {REWRITER_MODEL_ID}")
+
+    # The rewriter instructions are the exact-match scope; only the user's
+    # prompt is compared semantically.
+    cache_scope = f"rewriter:{REWRITER_MODEL_ID}:{rewriter_prompt}"
+    embedding = None
+    if semantic_cache:
+        cached_text, embedding = semantic_cache.lookup(original_prompt, cache_scope)
+        if cached_text:
+            analytics_logger.info("Rewriter semantic cache hit")
+            return cached_text
+
     try:
-        with track_model_call(model_name=REWRITER_MODEL_ID, task="rewriter"):
-            response = client.models.generate_content(
-                model=REWRITER_MODEL_ID,  # Explicitly use the configured model
-                contents=full_prompt,
-                config=types.GenerateContentConfig(
-                    response_modalities=["TEXT"],
-                ),
-            )
-        analytics_logger.info(f"Rewriter success! {response.text}")
-        return response.text
+        response_text = "".join(rewriter_stream(original_prompt, rewriter_prompt))
+        analytics_logger.info(f"Rewriter success! {response_text}")
+        if semantic_cache:
+            semantic_cache.store(cache_scope, embedding, response_text)
+        return response_text
     except Exception as e:
         analytics_logger.error(f"Rewriter error: {e}")
         raise
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
+_AUDIO_ANALYSIS_CONFIG = types.GenerateContentConfig(
+    system_instruction=_AUDIO_ANALYSIS_SYSTEM_INSTRUCTION,
+    safety_settings=_DEFAULT_SAFETY_SETTINGS,
+    # temperature=1.0,  # Corrected: float value
+    # top_p=1.0,  # Corrected: float value
+    # temperature=1.0,  # Corrected: float value
+    # top_p=1.0,  # Corrected: float value
+    # seed=0, # Seed might not be available in all models or SDK versions, or might be int
+    # max_output_tokens=8192,  # Max for Flash is 8192. 65535 is too high.
+    # max_output_tokens=8192,  # Max for Flash is 8192. 65535 is too high.
+    response_mime_type="application/json",  # This is key for JSON output
+    response_schema=_AUDIO_ANALYSIS_SCHEMA,
 )
+
+
+@_gemini_retry
 def analyze_audio_with_gemini(
     audio_uri: str, music_generation_prompt: str
 ) -> Optional[Dict[str, any]]:
@@ -307,81 +808,12 @@ def analyze_audio_with_gemini(
         raise  # Re-raise to be caught by tenacity or calling function
 
     # Prepare the text part, incorporating the dynamic music_generation_prompt
-    text_prompt_for_analysis = f"""Describe this musical clip ("audio-analysis"), then suggest a list of genres and qualities.
-
-The original prompt was the following:
-
-"{music_generation_prompt}"
-
-Then, review the original prompt with your description.
-
-Output this as JSON.
-
-"""
+    text_prompt_for_analysis = _AUDIO_ANALYSIS_TEMPLATE.format(
+        prompt=music_generation_prompt
+    )
 
     text_part = types.Part.from_text(text=text_prompt_for_analysis)
 
-    # System instruction
-    system_instruction_text = """You're a music producer and critic with a keen ear for describing musical qualities and soundscapes. If you're given audio, describe it. If you're given an idea or a scenario, describe the music that would represent that. Aim for a single paragraph description of musical direction and optionally any explanation of your direction. As a rule, don't refer to any particular artist, but instead describe their style."""
-    # system_instruction_part = types.Part.from_text(text=system_instruction_text) # API expects a Part or list of Parts
-
-    safety_settings_list = [
-        types.SafetySetting(
-            category=types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-            threshold=types.HarmBlockThreshold.BLOCK_NONE,
-        ),
-        types.SafetySetting(
-            category=types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-            threshold=types.HarmBlockThreshold.BLOCK_NONE,
-        ),
-        types.SafetySetting(
-            category=types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-            threshold=types.HarmBlockThreshold.BLOCK_NONE,
-        ),
-        types.SafetySetting(
-            category=types.HarmCategory.HARM_CATEGORY_HARASSMENT,
-            threshold=types.HarmBlockThreshold.BLOCK_NONE,
-        ),
-    ]
-
-    schema_json = {  # This is the schema from your sample
-        # "$schema": "http://json-schema.org/draft-07/schema#", # Schema for schema, optional here
-        "title": "Music Analysis and Alignment Response",
-        "description": "Schema for describing audio analysis, suggested genres/qualities, and alignment with an initial prompt.",
-        "type": "OBJECT",
-        "properties": {
-            "audio-analysis": {
-                "description": "A single-paragraph description of the provided audio or suggested musical direction.",
-                "type": "STRING",
-            },
-            "genre-quality": {
-                "description": "A list of suggested genres and descriptive musical qualities.",
-                "type": "ARRAY",
-                "items": {"type": "STRING"},
-                "minItems": 1,
-            },
-            "prompt-alignment": {
-                "description": "An evaluation of how well the audio or generated description aligns with the original prompt's requirements.",
-                "type": "STRING",
-            },
-        },
-        "required": ["audio-analysis", "genre-quality", "prompt-alignment"],
-        # "additionalProperties": False, # This can be strict; ensure model adheres or remove
-    }
-    generation_config_params = types.GenerateContentConfig(
-        system_instruction=system_instruction_text,
-        safety_settings=safety_settings_list,
-        # temperature=1.0,  # Corrected: float value
-        # top_p=1.0,  # Corrected: float value
-        # temperature=1.0,  # Corrected: float value
-        # top_p=1.0,  # Corrected: float value
-        # seed=0, # Seed might not be available in all models or SDK versions, or might be int
-        # max_output_tokens=8192,  # Max for Flash is 8192. 65535 is too high.
-        # max_output_tokens=8192,  # Max for Flash is 8192. 65535 is too high.
-        response_mime_type="application/json",  # This is key for JSON output
-        response_schema=schema_json,
-    )
-
     # Construct the contents for the API call
     contents_for_api = [
         types.Content(role="user", parts=[audio_part, text_part]),
@@ -394,7 +826,7 @@ Output this as JSON.
             response = client.models.generate_content(  # Or client.generate_content if client is a model instance
                 model=analysis_model_id,
                 contents=contents_for_api,
-                config=generation_config_params,
+                config=_AUDIO_ANALYSIS_CONFIG,
             )
 
         analytics_logger.info("Received response from Gemini.")
@@ -402,7 +834,7 @@ Output this as JSON.
 
         # Assuming the response.text contains the JSON string due to response_mime_type
         if response.text:
-            parsed_json = json.loads(response.text)
+            parsed_json = from_json(response.text)
             analytics_logger.info(f"Successfully parsed analysis JSON: {parsed_json}")
             return parsed_json
             # return response.text
@@ -415,7 +847,7 @@ Output this as JSON.
                     part.text for part in response.parts if hasattr(part, "text")
                 )
                 if json_text_from_parts:
-                    parsed_json = json.loads(json_text_from_parts)
+                    parsed_json = from_json(json_text_from_parts)
                     analytics_logger.info(
                         f"Successfully parsed analysis JSON from parts: {parsed_json}"
                     )
@@ -430,111 +862,107 @@ Output this as JSON.
         raise  # Re-raise for tenacity or the caller
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
+_IMAGE_CRITIQUE_CONFIG = types.GenerateContentConfig(
+    response_modalities=["TEXT"],
+    safety_settings=_DEFAULT_SAFETY_SETTINGS,
+    max_output_tokens=8192,
 )
-def image_critique(original_prompt: str, img_uris: list[str]) -> str:
-    """Image critic
+
+
+def image_critique_stream(original_prompt: str, img_uris: list[str]) -> Iterator[str]:
+    """Streams an image critique chunk by chunk.
+
+    Not retried: a partially consumed stream cannot be replayed. Use
+    `image_critique` when the complete text is needed.
 
     Args:
+        original_prompt (str): the prompt the images were generated from
         img_uris (list[str]): a list of GCS URIs of images to critique
 
-    Returns:
-        str: critique of images
+    Yields:
+        str: successive chunks of the critique text
     """
-
     critic_prompt = MAGAZINE_EDITOR_PROMPT.format(original_prompt)
 
     prompt_parts = [critic_prompt]
 
-    for img_uri in img_uris:
+    unique_uris = list(dict.fromkeys(img_uris))  # Order-preserving dedupe
+    if len(unique_uris) < len(img_uris):
+        analytics_logger.info(
+            f"Dropped {len(img_uris) - len(unique_uris)} duplicate image(s) from critique."
+        )
+
+    for img_uri in unique_uris:
         prompt_parts.append(
             types.Part.from_uri(file_uri=img_uri, mime_type="image/png")
         )
 
-    safety_settings_list = [
-        types.SafetySetting(
-            category=types.HarmCategory.HARM_CATEGORY_HATE_SPEECH,
-            threshold=types.HarmBlockThreshold.BLOCK_NONE,
-        ),
-        types.SafetySetting(
-            category=types.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT,
-            threshold=types.HarmBlockThreshold.BLOCK_NONE,
-        ),
-        types.SafetySetting(
-            category=types.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT,
-            threshold=types.HarmBlockThreshold.BLOCK_NONE,
-        ),
-        types.SafetySetting(
-            category=types.HarmCategory.HARM_CATEGORY_HARASSMENT,
-            threshold=types.HarmBlockThreshold.BLOCK_NONE,
-        ),
-    ]
-    # prompt_parts is already a list of Part-like objects (str, Part).
-    # The SDK will form a single Content message from this list.
-    # No need to wrap it in types.Content manually here if it's for a single turn.
-    # contents_payload = [types.Content(role="user", parts=prompt_parts)] # This would be for multi-turn history
-
-    # For a single user message with multiple parts:
+    # For a single user message with multiple parts, the SDK forms a single
+    # Content message from this list of Part-like objects (str, Part).
     contents_payload = prompt_parts
 
     # The telemetry.tool_context_manager is from the Vertex AI SDK,
     # client here is from google-genai, so this context manager might not apply or could cause issues.
     # If it's not needed or causes errors, it should be removed.
     # Assuming it's a no-op or handled if telemetry is not configured for google-genai.
+    # Imported here: google.cloud.aiplatform is slow to import and only needed here.
+    from google.cloud.aiplatform import telemetry
+
     with telemetry.tool_context_manager("creative-studio"):
-        try:
-            # Use default model from config for critique, unless a specific one is configured
-            critique_model_id = (
-                cfg.MODEL_ID
-            )  # Or a specific cfg.GEMINI_CRITIQUE_MODEL_ID
-            analytics_logger.info(
-                f"Sending critique request to Gemini model: {critique_model_id} with {len(contents_payload)} parts."
-            )
+        # Use default model from config for critique, unless a specific one is configured
+        critique_model_id = cfg.MODEL_ID  # Or a specific cfg.GEMINI_CRITIQUE_MODEL_ID
+        analytics_logger.info(
+            f"Sending critique request to Gemini model: {critique_model_id} with {len(contents_payload)} parts."
+        )
+        yield from _stream_content_text(
+            critique_model_id,
+            contents_payload,
+            _IMAGE_CRITIQUE_CONFIG,
+            task="image_critique",
+        )
 
-            with track_model_call(model_name=critique_model_id, task="image_critique"):
-                response = client.models.generate_content(
-                    model=critique_model_id,
-                    contents=contents_payload,
-                    config=types.GenerateContentConfig(
-                        response_modalities=["TEXT"],
-                        safety_settings=safety_settings_list,
-                        max_output_tokens=8192,
-                    ),
-                )
 
-            analytics_logger.info("Received critique response from Gemini.")
-
-            if response.text:
-                analytics_logger.info(
-                    f"Critique generated (truncated): {response.text[:200]}..."
-                )  # Log a snippet
-                return response.text  # Return the text directly
-            # Fallback for safety reasons, though .text should be populated for text responses
-            elif (
-                response.candidates
-                and response.candidates[0].content.parts
-                and response.candidates[0].content.parts[0].text
-            ):
-                text_response = response.candidates[0].content.parts[0].text
-                analytics_logger.info(
-                    f"Critique generated (truncated): {text_response[:200]}..."
-                )
-                return text_response
-            else:
-                analytics_logger.warning(
-                    "Gemini critique response text was empty or response structure unexpected."
-                )
-                return "Critique could not be generated (empty or unexpected response)."
+@_gemini_retry
+def image_critique(original_prompt: str, img_uris: list[str]) -> str:
+    """Image critic
 
-        except Exception as e:
-            analytics_logger.error(
-                f"Error during Gemini API call for image critique: {e}"
-            )
-            raise
+    Args:
+        img_uris (list[str]): a list of GCS URIs of images to critique
+
+    Returns:
+        str: critique of images
+    """
+
+    # The images being critiqued are the exact-match scope; the prompt is
+    # compared semantically.
+    cache_scope = "image_critique:" + "|".join(sorted(set(img_uris)))
+    embedding = None
+    if semantic_cache:
+        cached_text, embedding = semantic_cache.lookup(original_prompt, cache_scope)
+        if cached_text:
+            analytics_logger.info("Image critique semantic cache hit")
+            return cached_text
+
+    try:
+        critique = "".join(image_critique_stream(original_prompt, img_uris))
+    except Exception as e:
+        analytics_logger.error(f"Error during Gemini API call for image critique: {e}")
+        raise
+
+    analytics_logger.info("Received critique response from Gemini.")
+
+    if not critique:
+        analytics_logger.warning(
+            "Gemini critique response text was empty or response structure unexpected."
+        )
+        return "Critique could not be generated (empty or unexpected response)."
+
+    analytics_logger.info(
+        f"Critique generated (truncated): {critique[:200]}..."
+    )  # Log a snippet
+    if semantic_cache:
+        semantic_cache.store(cache_scope, embedding, critique)
+    return critique
 
 
 def rewrite_prompt_with_gemini(original_prompt: str) -> str:
@@ -563,7 +991,7 @@ def generate_compliment(generation_instruction: str, image_output):
     Generates a Gemini-powered critique/commentary for the generated images.
     Updates PageState.image_commentary and PageState.error_message directly.
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     critique_text = ""
     error_for_this_op = ""
 
@@ -589,8 +1017,7 @@ def generate_compliment(generation_instruction: str, image_output):
         )
         error_for_this_op = f"Unexpected error during critique: {str(err_generic)}"
     finally:
-        end_time = time.time()
-        execution_time = end_time - start_time
+        execution_time = time.perf_counter() - start_time
         timing = f"Critique generation time: {execution_time:.2f} seconds"  # More precise timing
         analytics_logger.info(timing)
 
@@ -601,66 +1028,150 @@ def generate_compliment(generation_instruction: str, image_output):
     return critique_text
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
+_WEBP_MIN_BYTES = 64_000
+
+
+def _inline_image_part(image_bytes: bytes, max_edge: int = 1024) -> types.Part:
+    """Builds an inline part for an image, downsized and compressed in one pass.
+
+    Gemini bills images per tile, so oversized inputs cost tokens and upload
+    time without improving the analysis; they are scaled down so their
+    longest edge is at most `max_edge` pixels. Resized images, and images of
+    _WEBP_MIN_BYTES or more, are encoded once as WebP, which is typically
+    several times smaller than the equivalent PNG and so shrinks the base64
+    request payload. Other images, and images PIL cannot decode, are sent
+    as-is.
+    """
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            oversized = max(img.size) > max_edge
+            if not oversized and len(image_bytes) < _WEBP_MIN_BYTES:
+                return types.Part.from_bytes(data=image_bytes, mime_type="image/png")
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA")
+            if oversized:
+                img.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            img.save(buffer, format="WEBP", quality=85, method=4)
+    except Exception as e:
+        analytics_logger.warning(f"Could not re-encode image, sending as-is: {e}")
+        return types.Part.from_bytes(data=image_bytes, mime_type="image/png")
+    return types.Part.from_bytes(data=buffer.getvalue(), mime_type="image/webp")
+
+
+_PROFILE_AND_DESCRIPTION_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=_PROFILE_AND_DESCRIPTION_SCHEMA,
+    temperature=cfg.TEMP_FORENSIC_ANALYSIS,
 )
-def get_facial_composite_profile(image_bytes: bytes) -> FacialCompositeProfile:
-    """Analyzes an image and returns a structured facial profile."""
+
+
+@_gemini_retry
+async def aget_profile_and_description(
+    image_bytes: bytes,
+) -> tuple[FacialCompositeProfile, str]:
+    """Extracts a facial profile and its natural language description in one call.
+
+    Equivalent to get_facial_composite_profile followed by
+    get_natural_language_description, without the second round-trip.
+    """
     model_name = cfg.CHARACTER_CONSISTENCY_GEMINI_MODEL
 
-    profile_config = types.GenerateContentConfig(
-        response_mime_type="application/json",
-        response_schema=FacialCompositeProfile.model_json_schema(),
-        temperature=cfg.TEMP_FORENSIC_ANALYSIS,
-    )
-    profile_prompt_parts = [
+    image_part = await asyncio.to_thread(_inline_image_part, image_bytes)
+    prompt_parts = [
         "You are a forensic analyst. Analyze the following image and extract a detailed, structured facial profile.",
-        types.Part.from_bytes(data=image_bytes, mime_type="image/png"),
+        "Then, based on that profile, write a concise, natural language description suitable for an image generation model. Focus on key physical traits.",
+        image_part,
     ]
-    with track_model_call(model_name=model_name, task="get_facial_composite_profile"):
-        response = client.models.generate_content(
-            model=model_name, contents=profile_prompt_parts, config=profile_config
-        )
-    return FacialCompositeProfile.model_validate_json(response.text)
+    response_text = await _agenerate_content_text(
+        model_name,
+        prompt_parts,
+        _PROFILE_AND_DESCRIPTION_CONFIG,
+        task="get_profile_and_description",
+    )
+    result = FacialProfileWithDescription.model_validate_json(response_text)
+    return result.profile, result.natural_language_description.strip()
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
+def get_profile_and_description(
+    image_bytes: bytes,
+) -> tuple[FacialCompositeProfile, str]:
+    """Extracts a facial profile and its natural language description in one call."""
+    return run_sync(aget_profile_and_description(image_bytes))
+
+
+def get_facial_composite_profile(image_bytes: bytes) -> FacialCompositeProfile:
+    """Analyzes an image and returns a structured facial profile.
+
+    Deprecated: use get_profile_and_description, which also returns the
+    natural language description from the same call.
+    """
+    warnings.warn(
+        "get_facial_composite_profile is deprecated; use get_profile_and_description.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    profile, _ = get_profile_and_description(image_bytes)
+    return profile
+
+
+async def _agather_profiles_and_descriptions(
+    image_bytes_list: list[bytes],
+) -> list[tuple[FacialCompositeProfile, str]]:
+    return await asyncio.gather(
+        *(aget_profile_and_description(b) for b in image_bytes_list)
+    )
+
+
+def get_profiles_and_descriptions(
+    image_bytes_list: list[bytes],
+) -> list[tuple[FacialCompositeProfile, str]]:
+    """Profiles and describes several images concurrently, preserving input order."""
+    return run_sync(_agather_profiles_and_descriptions(image_bytes_list))
+
+
+_DESCRIPTION_TRANSLATION_CONFIG = types.GenerateContentConfig(
+    temperature=cfg.TEMP_DESCRIPTION_TRANSLATION
 )
+
+
+@_gemini_retry
 def get_natural_language_description(profile: FacialCompositeProfile) -> str:
-    """Generates a natural language description from a facial profile."""
-    model_name = cfg.CHARACTER_CONSISTENCY_GEMINI_MODEL
+    """Generates a natural language description from a facial profile.
 
-    description_config = types.GenerateContentConfig(
-        temperature=cfg.TEMP_DESCRIPTION_TRANSLATION
+    Deprecated: get_profile_and_description returns the description together
+    with the profile in one call. Kept for callers that already hold a profile.
+    """
+    warnings.warn(
+        "get_natural_language_description is deprecated; use get_profile_and_description.",
+        DeprecationWarning,
+        stacklevel=2,
     )
+    model_name = cfg.CHARACTER_CONSISTENCY_GEMINI_MODEL
+
     description_prompt = f"""
     Based on the following structured JSON data of a person's facial features, write a concise, natural language description suitable for an image generation model. Focus on key physical traits.
 
     JSON Profile:
-    {profile.model_dump_json(indent=2)}
+    {profile.model_dump_json()}
     """
-    with track_model_call(
-        model_name=model_name, task="get_natural_language_description"
-    ):
-        response = client.models.generate_content(
-            model=model_name, contents=[description_prompt], config=description_config
-        )
-    return response.text.strip()
+    response_text = _generate_content_text(
+        model_name,
+        [description_prompt],
+        _DESCRIPTION_TRANSLATION_CONFIG,
+        task="get_natural_language_description",
+    )
+    return response_text.strip()
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
+_SCENE_PROMPT_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=_GENERATED_PROMPTS_SCHEMA,
+    temperature=cfg.TEMP_SCENE_GENERATION,
 )
+
+
+@_gemini_retry
 def generate_final_scene_prompt(
     base_description: str, user_prompt: str
 ) -> GeneratedPrompts:
@@ -669,11 +1180,6 @@ def generate_final_scene_prompt(
     in a novel scene.
     """
     model_name = cfg.CHARACTER_CONSISTENCY_GEMINI_MODEL
-    config = types.GenerateContentConfig(
-        response_mime_type="application/json",
-        response_schema=GeneratedPrompts.model_json_schema(),
-        temperature=cfg.TEMP_SCENE_GENERATION,
-    )
 
     meta_prompt = f"""
     You are an expert prompt engineer for a text-to-image generation model.
@@ -691,21 +1197,45 @@ def generate_final_scene_prompt(
     3.  Ensure the final prompt clearly describes the person performing the action or being in the scene requested by the user.
     4.  Generate a standard negative prompt to avoid common artistic flaws.
     """
-    with track_model_call(model_name=model_name, task="generate_final_scene_prompt"):
-        response = client.models.generate_content(
-            model=model_name, contents=[meta_prompt], config=config
+    response_text = _generate_content_text(
+        model_name,
+        [meta_prompt],
+        _SCENE_PROMPT_CONFIG,
+        task="generate_final_scene_prompt",
+    )
+    return GeneratedPrompts.model_validate_json(response_text)
+
+
+def _image_uri_parts(image_gcs_uris: list[str], labelled: bool = True) -> list:
+    """Builds prompt parts that reference images in GCS, each distinct URI once.
+
+    Gemini reads the objects directly, so the images never have to be
+    downloaded and re-uploaded inline.
+    """
+    uris = dict.fromkeys(image_gcs_uris)
+    if not labelled:
+        return [types.Part.from_uri(file_uri=uri, mime_type="image/png") for uri in uris]
+    return [
+        part
+        for uri in uris
+        for part in (
+            f"Image path: {uri}",
+            types.Part.from_uri(file_uri=uri, mime_type="image/png"),
         )
-    return GeneratedPrompts.model_validate_json(response.text)
+    ]
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
+_SELECT_BEST_IMAGE_CONFIG = types.GenerateContentConfig(
+    thinking_config=types.ThinkingConfig(thinking_budget=-1),
+    response_mime_type="application/json",
+    response_schema=_BEST_IMAGE_SCHEMA,
+    temperature=cfg.TEMP_BEST_IMAGE_SELECTION,
 )
-def select_best_image(
-    real_image_bytes_list: list[bytes],
+
+
+@_gemini_retry
+async def aselect_best_image(
+    real_image_gcs_uris: list[str],
     generated_image_bytes_list: list[bytes],
     generated_image_gcs_uris: list[str],
 ) -> BestImage:
@@ -713,12 +1243,6 @@ def select_best_image(
     images.
     """
     model = cfg.CHARACTER_CONSISTENCY_GEMINI_MODEL
-    config = types.GenerateContentConfig(
-        thinking_config=types.ThinkingConfig(thinking_budget=-1),
-        response_mime_type="application/json",
-        response_schema=BestImage.model_json_schema(),
-        temperature=cfg.TEMP_BEST_IMAGE_SELECTION,
-    )
 
     prompt_parts = [
         "Please analyze the following images. The first set of images are real photos of a person. The second set of images are AI-generated.",
@@ -727,30 +1251,56 @@ def select_best_image(
         "\n--- REAL IMAGES ---",
     ]
 
-    for image_bytes in real_image_bytes_list:
-        prompt_parts.append(
-            types.Part.from_bytes(data=image_bytes, mime_type="image/png")
-        )
+    # Real photos are already in GCS; referencing them by URI keeps them out
+    # of the request body and gives a stable prompt prefix across calls.
+    prompt_parts.extend(_image_uri_parts(real_image_gcs_uris, labelled=False))
 
     prompt_parts.append("\n--- GENERATED IMAGES ---")
 
-    for i, image_bytes in enumerate(generated_image_bytes_list):
-        prompt_parts.append(f"Image path: {generated_image_gcs_uris[i]}")
-        prompt_parts.append(
-            types.Part.from_bytes(data=image_bytes, mime_type="image/png")
-        )
+    generated_image_parts = await asyncio.gather(
+        *(asyncio.to_thread(_inline_image_part, b) for b in generated_image_bytes_list)
+    )
+    prompt_parts.extend(
+        part
+        for uri, image_part in zip(generated_image_gcs_uris, generated_image_parts)
+        for part in (f"Image path: {uri}", image_part)
+    )
 
-    with track_model_call(model_name=model, task="select_best_image"):
-        response = client.models.generate_content(
-            model=model, contents=prompt_parts, config=config
-        )
+    response = await agenerate_content(
+        model, prompt_parts, _SELECT_BEST_IMAGE_CONFIG, task="select_best_image"
+    )
     return BestImage.model_validate_json(response.text)
 
 
-def select_best_image_with_description(
-    real_image_bytes_list: list[bytes],
+def select_best_image(
+    real_image_gcs_uris: list[str],
     generated_image_bytes_list: list[bytes],
     generated_image_gcs_uris: list[str],
+) -> BestImage:
+    """Selects the best generated image by comparing it against a set of real
+    images.
+    """
+    return run_sync(
+        aselect_best_image(
+            real_image_gcs_uris, generated_image_bytes_list, generated_image_gcs_uris
+        )
+    )
+
+
+_BEST_IMAGE_ACCURACY_CONFIG = types.GenerateContentConfig(
+    thinking_config=types.ThinkingConfig(
+        thinking_budget=cfg.GEMINI_CRITIC_THINKING_BUDGET
+    ),
+    response_mime_type="application/json",
+    response_schema=_BEST_IMAGE_ACCURACY_SCHEMA,
+    temperature=cfg.TEMP_BEST_IMAGE_SELECTION,
+)
+
+
+@_gemini_retry
+async def aselect_best_image_with_description(
+    real_image_gcs_uris: list[str],
+    generated_image_gcs_uris: list[str],
     real_photo_description: str,
     ai_photo_description: str,
 ) -> BestImageAccuracy:
@@ -758,12 +1308,6 @@ def select_best_image_with_description(
     images.
     """
     model = cfg.CHARACTER_CONSISTENCY_GEMINI_MODEL
-    config = types.GenerateContentConfig(
-        thinking_config=types.ThinkingConfig(thinking_budget=-1),
-        response_mime_type="application/json",
-        response_schema=BestImageAccuracy.model_json_schema(),
-        temperature=cfg.TEMP_BEST_IMAGE_SELECTION,
-    )
 
     prompt_parts = [
         "Please analyze the following images. The first set of images are photos of {}. The second set of images are AI-generated images of a model wearing the articles of clothing.".format(
@@ -776,41 +1320,59 @@ def select_best_image_with_description(
         "\n--- REAL IMAGES ---",
     ]
 
-    for image_bytes in real_image_bytes_list:
-        prompt_parts.append(
-            types.Part.from_bytes(data=image_bytes, mime_type="image/png")
-        )
+    prompt_parts.extend(_image_uri_parts(real_image_gcs_uris, labelled=False))
 
     prompt_parts.append("\n--- GENERATED IMAGES ---")
 
-    for i, image_bytes in enumerate(generated_image_bytes_list):
-        prompt_parts.append(f"Image path: {generated_image_gcs_uris[i]}")
-        prompt_parts.append(
-            types.Part.from_bytes(data=image_bytes, mime_type="image/png")
-        )
+    prompt_parts.extend(_image_uri_parts(generated_image_gcs_uris))
 
-    with track_model_call(model_name=model, task="select_best_image_with_description"):
-        response = client.models.generate_content(
-            model=model, contents=prompt_parts, config=config
-        )
+    response = await agenerate_content(
+        model,
+        prompt_parts,
+        _BEST_IMAGE_ACCURACY_CONFIG,
+        task="select_best_image_with_description",
+    )
     return BestImageAccuracy.model_validate_json(response.text)
 
 
-def final_image_critic(
-    article_image_bytes_list: list[bytes],
+def select_best_image_with_description(
+    real_image_gcs_uris: list[str],
+    generated_image_gcs_uris: list[str],
+    real_photo_description: str,
+    ai_photo_description: str,
+) -> BestImageAccuracy:
+    """Selects the best generated image by comparing it against a set of real
+    images.
+    """
+    return run_sync(
+        aselect_best_image_with_description(
+            real_image_gcs_uris,
+            generated_image_gcs_uris,
+            real_photo_description,
+            ai_photo_description,
+        )
+    )
+
+
+_FINAL_IMAGE_CRITIC_CONFIG = types.GenerateContentConfig(
+    thinking_config=types.ThinkingConfig(
+        thinking_budget=cfg.GEMINI_CRITIC_THINKING_BUDGET
+    ),
+    response_mime_type="application/json",
+    response_schema=_GENERATED_IMAGE_ACCURACY_SCHEMA,
+    temperature=cfg.TEMP_BEST_IMAGE_SELECTION,
+)
+
+
+@_gemini_retry
+async def afinal_image_critic(
     article_image_gcs_uris: list[str],
-    generated_image_bytes_list: list[bytes],
+    generated_image_gcs_uris: list[str],
 ) -> GeneratedImageAccuracyWrapper:
     """Selects the best generated image by comparing it against a set of real
     images. Provide feedback on accuracy.
     """
     model = cfg.CHARACTER_CONSISTENCY_GEMINI_MODEL
-    config = types.GenerateContentConfig(
-        thinking_config=types.ThinkingConfig(thinking_budget=-1),
-        response_mime_type="application/json",
-        response_schema=GeneratedImageAccuracyWrapper.model_json_schema(),
-        temperature=cfg.TEMP_BEST_IMAGE_SELECTION,
-    )
 
     prompt_parts = [
         "The first set of images are photos of apparel items. The generated image is AI-generated image of a model wearing the apparel items.",
@@ -819,43 +1381,45 @@ def final_image_critic(
         "\n--- APAREL IMAGES ---",
     ]
 
-    for i, image_bytes in enumerate(article_image_bytes_list):
-        prompt_parts.append(f"Image path: {article_image_gcs_uris[i]}")
-        prompt_parts.append(
-            types.Part.from_bytes(data=image_bytes, mime_type="image/png")
-        )
+    prompt_parts.extend(_image_uri_parts(article_image_gcs_uris))
 
     prompt_parts.append("\n--- GENERATED IMAGE ---")
 
-    for i, image_bytes in enumerate(generated_image_bytes_list):
-        prompt_parts.append(
-            types.Part.from_bytes(data=image_bytes, mime_type="image/png")
-        )
+    prompt_parts.extend(_image_uri_parts(generated_image_gcs_uris, labelled=False))
 
-    with track_model_call(model_name=model, task="final_image_critic"):
-        response = client.models.generate_content(
-            model=model, contents=prompt_parts, config=config
-        )
+    response = await agenerate_content(
+        model, prompt_parts, _FINAL_IMAGE_CRITIC_CONFIG, task="final_image_critic"
+    )
     return GeneratedImageAccuracyWrapper.model_validate_json(response.text)
 
 
-def describe_images_and_look(
-    look_articles: list[CatalogRecord],
-) -> ArticleDescriptionWrapper:
-    """Describe the overall aestetic of an outfit in addition to describing
-    each article seperately.
+def final_image_critic(
+    article_image_gcs_uris: list[str],
+    generated_image_gcs_uris: list[str],
+) -> GeneratedImageAccuracyWrapper:
+    """Selects the best generated image by comparing it against a set of real
+    images. Provide feedback on accuracy.
     """
-    config = types.GenerateContentConfig(
-        thinking_config=types.ThinkingConfig(thinking_budget=-1),
-        response_mime_type="application/json",
-        response_schema=ArticleDescriptionWrapper.model_json_schema(),
-        temperature=cfg.TEMP_BEST_IMAGE_SELECTION,
+    return run_sync(
+        afinal_image_critic(article_image_gcs_uris, generated_image_gcs_uris)
     )
-    model = cfg.CHARACTER_CONSISTENCY_GEMINI_MODEL
 
+
+_DESCRIBE_LOOK_CONFIG = types.GenerateContentConfig(
+    thinking_config=types.ThinkingConfig(
+        thinking_budget=cfg.GEMINI_DESCRIPTION_THINKING_BUDGET
+    ),
+    response_mime_type="application/json",
+    response_schema=_ARTICLE_DESCRIPTION_SCHEMA,
+    temperature=cfg.TEMP_BEST_IMAGE_SELECTION,
+)
+
+
+def _describe_look_contents(look_articles: list[CatalogRecord]) -> list:
+    """Builds the describe-look prompt for a set of catalog articles."""
     prompt_parts = [
         "The following images of {} are articles of clothing to be worn as an outfit.".format(
-            ",".join(i.article_type for i in look_articles)
+            ",".join(a.article_type for a in look_articles)
         ),
         "Your task is describe each article of clothing in a style of a product catalog, within 3 sentences each.",
         "Also, you also should generate a description of the entire outfit as look_description when all articles are worn together as an outfit.",
@@ -867,31 +1431,60 @@ def describe_images_and_look(
         prompt_parts.append(
             types.Part.from_uri(file_uri=a.clothing_image, mime_type="image/png")
         )
+    return prompt_parts
 
-    with track_model_call(model_name=model, task="describe_images_and_look"):
-        response = client.models.generate_content(
-            model=model, contents=prompt_parts, config=config
-        )
 
-    return ArticleDescriptionWrapper.model_validate_json(response.text)
+def describe_images_and_look_stream(
+    look_articles: list[CatalogRecord],
+) -> Iterator[ArticleDescriptionWrapper]:
+    """Describe the overall aestetic of an outfit in addition to describing
+    each article seperately.
 
+    Yields a snapshot each time another article description completes, so
+    callers can show descriptions as they arrive; look_description is empty
+    until it has been generated. The last item yielded is the full, validated
+    result. Repeated looks are served from the response cache.
+    """
+    model = cfg.CHARACTER_CONSISTENCY_GEMINI_MODEL
+    contents = _describe_look_contents(look_articles)
+    task = "describe_images_and_look"
+
+    key, hit = _cache_lookup(model, contents, _DESCRIBE_LOOK_CONFIG, task)
+    if hit is not None:
+        yield ArticleDescriptionWrapper.model_validate_json(hit)
+        return
+
+    chunks = []
+    completed = 0
+    for text in _stream_content_text(model, contents, _DESCRIBE_LOOK_CONFIG, task):
+        chunks.append(text)
+        try:
+            partial = from_json("".join(chunks), allow_partial=True)
+        except ValueError:
+            continue
+        if not isinstance(partial, dict):
+            continue
+        # Incomplete trailing strings are dropped from a partial parse, so an
+        # article with both fields present is finished.
+        articles = [
+            a
+            for a in partial.get("articles", [])
+            if "article_image_path" in a and "article_description" in a
+        ]
+        if len(articles) > completed:
+            completed = len(articles)
+            yield ArticleDescriptionWrapper.model_construct(
+                articles=[ArticleDescription.model_validate(a) for a in articles],
+                look_description=partial.get("look_description", ""),
+            )
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
-)
-def generate_transformation_prompts(image_uris: list[str]) -> list[Transformation]:
-    """Generate three transformation prompts for a given image."""
-    model_name = cfg.MODEL_ID
-    config = types.GenerateContentConfig(
-        response_mime_type="application/json",
-        response_schema=TransformationPrompts.model_json_schema(),
-        temperature=0.8,
-    )
+    response_text = "".join(chunks)
+    result = ArticleDescriptionWrapper.model_validate_json(response_text)
+    _cache_store(key, response_text)
+    yield result
 
-    prompt_text = """Analyze these images and come up with 3 interesting transformations.
+
+_TRANSFORMATION_PROMPT_TEXT = """Analyze these images and come up with 3 interesting transformations.
     
     For each transformation, provide a short title (max 3 words) and a detailed prompt for the image generation model.
     
@@ -906,61 +1499,98 @@ def generate_transformation_prompts(image_uris: list[str]) -> list[Transformatio
     
     """
 
-    prompt_parts = [prompt_text]
-    for uri in image_uris:
-        prompt_parts.append(types.Part.from_uri(file_uri=uri, mime_type="image/png"))
+
+_TRANSFORMATION_PROMPTS_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=_TRANSFORMATION_PROMPTS_SCHEMA,
+    temperature=0.8,
+)
+
+
+@_gemini_retry
+def generate_transformation_prompts(image_uris: list[str]) -> list[Transformation]:
+    """Generate three transformation prompts for a given image."""
+    model_name = cfg.MODEL_ID
+
+    prompt_parts = [
+        _TRANSFORMATION_PROMPT_TEXT,
+        *(
+            types.Part.from_uri(file_uri=uri, mime_type="image/png")
+            for uri in image_uris
+        ),
+    ]
 
     with track_model_call(
         model_name=model_name, task="generate_transformation_prompts"
     ):
         response = client.models.generate_content(
-            model=model_name, contents=prompt_parts, config=config
+            model=model_name,
+            contents=prompt_parts,
+            config=_TRANSFORMATION_PROMPTS_CONFIG,
         )
 
     prompts = TransformationPrompts.model_validate_json(response.text)
     return prompts.transformations
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
-)
-def describe_image(image_uri: str) -> str:
+_DESCRIBE_MEDIA_CONFIG = types.GenerateContentConfig(temperature=0.2)
+
+
+@_gemini_retry
+async def adescribe_image(image_uri: str) -> str:
     """Generates a two-sentence description for a given image."""
     model_name = cfg.MODEL_ID
-    config = types.GenerateContentConfig(temperature=0.2)
     prompt_parts = [
         "Describe this image in two sentences.",
         types.Part.from_uri(file_uri=image_uri, mime_type="image/png"),
     ]
-    with track_model_call(model_name=model_name, task="describe_image"):
-        response = client.models.generate_content(
-            model=model_name, contents=prompt_parts, config=config
-        )
-    return response.text.strip()
+    response_text = await _agenerate_content_text(
+        model_name, prompt_parts, _DESCRIBE_MEDIA_CONFIG, task="describe_image"
+    )
+    return response_text.strip()
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
-)
-def describe_video(video_uri: str) -> str:
+def describe_image(image_uri: str) -> str:
+    """Generates a two-sentence description for a given image."""
+    return run_sync(adescribe_image(image_uri))
+
+
+def describe_images_as_completed(
+    image_uris: list[str],
+) -> Iterator[tuple[int, Union[str, BaseException]]]:
+    """Describes several images concurrently.
+
+    Yields (index into image_uris, description) as each one finishes, so
+    callers can show descriptions as they arrive. A failed description is
+    yielded as its exception rather than raised, so one bad image does not
+    discard the others.
+    """
+    futures = _submit_fan_out(adescribe_image(uri) for uri in image_uris)
+    index_by_future = {future: i for i, future in enumerate(futures)}
+    for future in concurrent.futures.as_completed(futures):
+        try:
+            yield index_by_future[future], future.result()
+        except Exception as e:
+            yield index_by_future[future], e
+
+
+@_gemini_retry
+async def adescribe_video(video_uri: str) -> str:
     """Generates a two-sentence description for a given video."""
     model_name = cfg.MODEL_ID
-    config = types.GenerateContentConfig(temperature=0.2)
     prompt_parts = [
         "Describe this video in two sentences, focusing on the main subject, action, and overall visual style.",
         types.Part.from_uri(file_uri=video_uri, mime_type="video/mp4"),
     ]
-    with track_model_call(model_name=model_name, task="describe_video"):
-        response = client.models.generate_content(
-            model=model_name, contents=prompt_parts, config=config
-        )
-    return response.text.strip()
+    response_text = await _agenerate_content_text(
+        model_name, prompt_parts, _DESCRIBE_MEDIA_CONFIG, task="describe_video"
+    )
+    return response_text.strip()
+
+
+def describe_video(video_uri: str) -> str:
+    """Generates a two-sentence description for a given video."""
+    return run_sync(adescribe_video(video_uri))
 
 
 class QuestionAnswer(BaseModel):
@@ -972,72 +1602,180 @@ class EvaluationResult(BaseModel):
     answers: list[QuestionAnswer]
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
+_EVALUATION_SCHEMA = EvaluationResult.model_json_schema()
+
+
+_EVALUATION_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=_EVALUATION_SCHEMA,
+    temperature=0.1,
 )
-def evaluate_media_with_questions(
+
+
+@_gemini_retry
+async def aevaluate_media_with_questions(
     media_uri: str, mime_type: str, questions: list[str]
 ) -> EvaluationResult:
     """Evaluates a media file against a list of yes/no questions."""
     model_name = cfg.MODEL_ID
-    config = types.GenerateContentConfig(
-        response_mime_type="application/json",
-        response_schema=EvaluationResult.model_json_schema(),
-        temperature=0.1,
-    )
 
     prompt = "For the following media, answer each of the following questions with a simple 'yes' or 'no'. Return the answers as a structured JSON list of question and answer pairs.\n\n"
-    for q in questions:
-        prompt += f"- {q}\n"
+    prompt += "".join(f"- {q}\n" for q in questions)
 
     prompt_parts = [
         prompt,
         types.Part.from_uri(file_uri=media_uri, mime_type=mime_type),
     ]
 
-    with track_model_call(model_name=model_name, task="evaluate_media_with_questions"):
-        response = client.models.generate_content(
-            model=model_name, contents=prompt_parts, config=config
-        )
+    response_text = await _agenerate_content_text(
+        model_name,
+        prompt_parts,
+        _EVALUATION_CONFIG,
+        task="evaluate_media_with_questions",
+    )
+    return EvaluationResult.model_validate_json(response_text)
+
 
-    return EvaluationResult.model_validate_json(response.text)
+def evaluate_media_with_questions(
+    media_uri: str, mime_type: str, questions: list[str]
+) -> EvaluationResult:
+    """Evaluates a media file against a list of yes/no questions."""
+    return run_sync(aevaluate_media_with_questions(media_uri, mime_type, questions))
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
-)
-def evaluate_image_with_questions(
+@_gemini_retry
+async def aevaluate_image_with_questions(
     image_uri: str, questions: list[str]
 ) -> EvaluationResult:
     """Evaluates an image against a list of yes/no questions."""
     model_name = cfg.MODEL_ID
-    config = types.GenerateContentConfig(
-        response_mime_type="application/json",
-        response_schema=EvaluationResult.model_json_schema(),
-        temperature=0.1,
-    )
 
     prompt = "For the following image, answer each of the following questions with a simple 'yes' or 'no'. Return the answers as a structured JSON list of question and answer pairs.\n\n"
-    for q in questions:
-        prompt += f"- {q}\n"
+    prompt += "".join(f"- {q}\n" for q in questions)
 
     prompt_parts = [
         prompt,
         types.Part.from_uri(file_uri=image_uri, mime_type="image/png"),
     ]
 
-    with track_model_call(model_name=model_name, task="evaluate_image_with_questions"):
-        response = client.models.generate_content(
-            model=model_name, contents=prompt_parts, config=config
+    response_text = await _agenerate_content_text(
+        model_name,
+        prompt_parts,
+        _EVALUATION_CONFIG,
+        task="evaluate_image_with_questions",
+    )
+    return EvaluationResult.model_validate_json(response_text)
+
+
+def evaluate_image_with_questions(
+    image_uri: str, questions: list[str]
+) -> EvaluationResult:
+    """Evaluates an image against a list of yes/no questions."""
+    return run_sync(aevaluate_image_with_questions(image_uri, questions))
+
+
+class ImageEvaluation(BaseModel):
+    image_uri: str
+    answers: list[QuestionAnswer]
+
+
+class BatchEvaluationResult(BaseModel):
+    results: list[ImageEvaluation]
+
+
+_BATCH_EVALUATION_SCHEMA = BatchEvaluationResult.model_json_schema()
+_BATCH_EVALUATION_MAX_IMAGES = 16  # Images per request in batch evaluation
+
+
+_BATCH_EVALUATION_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=_BATCH_EVALUATION_SCHEMA,
+    temperature=0.1,
+)
+
+
+@_gemini_retry
+async def _aevaluate_image_batch(
+    image_uris: list[str], questions: list[str]
+) -> dict[str, EvaluationResult]:
+    """Evaluates up to _BATCH_EVALUATION_MAX_IMAGES images in one request."""
+    model_name = cfg.MODEL_ID
+
+    prompt = "For each of the following images, answer each of the following questions with a simple 'yes' or 'no'. Return one result per image, identified by the image URI given before it, each with a structured JSON list of question and answer pairs.\n\n"
+    prompt += "".join(f"- {q}\n" for q in questions)
+
+    prompt_parts = [prompt]
+    for image_uri in image_uris:
+        prompt_parts.append(f"Image {image_uri}:")
+        prompt_parts.append(
+            types.Part.from_uri(file_uri=image_uri, mime_type="image/png")
+        )
+
+    response_text = await _agenerate_content_text(
+        model_name,
+        prompt_parts,
+        _BATCH_EVALUATION_CONFIG,
+        task="batch_evaluate_images_with_questions",
+    )
+    # One pass of pydantic's JSON parser validates the whole batch; the
+    # per-image results reuse the validated answers without revalidating.
+    batch = BatchEvaluationResult.model_validate_json(response_text)
+    requested = set(image_uris)
+    return {
+        result.image_uri: EvaluationResult.model_construct(answers=result.answers)
+        for result in batch.results
+        if result.image_uri in requested
+    }
+
+
+async def abatch_evaluate_images_with_questions(
+    image_uris: list[str], questions: list[str]
+) -> dict[str, EvaluationResult]:
+    """Evaluates several images against the same yes/no questions.
+
+    Images are sent together, up to _BATCH_EVALUATION_MAX_IMAGES per request,
+    with the requests running concurrently. Any image the model leaves out of
+    its answer (or whose batch fails) is evaluated on its own. Images that
+    still cannot be evaluated are absent from the returned dict.
+    """
+    unique_uris = list(dict.fromkeys(image_uris))
+    batches = [
+        unique_uris[i : i + _BATCH_EVALUATION_MAX_IMAGES]
+        for i in range(0, len(unique_uris), _BATCH_EVALUATION_MAX_IMAGES)
+    ]
+    results: dict[str, EvaluationResult] = {}
+    batch_results = await asyncio.gather(
+        *(_aevaluate_image_batch(batch, questions) for batch in batches),
+        return_exceptions=True,
+    )
+    for batch_result in batch_results:
+        if isinstance(batch_result, BaseException):
+            analytics_logger.warning(f"Batch image evaluation failed: {batch_result}")
+        else:
+            results.update(batch_result)
+
+    missing = [uri for uri in unique_uris if uri not in results]
+    if missing:
+        analytics_logger.warning(
+            f"Evaluating {len(missing)} image(s) individually after batch evaluation."
         )
+        fallbacks = await asyncio.gather(
+            *(aevaluate_image_with_questions(uri, questions) for uri in missing),
+            return_exceptions=True,
+        )
+        for uri, fallback in zip(missing, fallbacks):
+            if isinstance(fallback, BaseException):
+                analytics_logger.error(f"Failed to evaluate image {uri}: {fallback}")
+            else:
+                results[uri] = fallback
+    return results
+
 
-    return EvaluationResult.model_validate_json(response.text)
+def batch_evaluate_images_with_questions(
+    image_uris: list[str], questions: list[str]
+) -> dict[str, EvaluationResult]:
+    """Evaluates several images against the same yes/no questions, keyed by URI."""
+    return run_sync(abatch_evaluate_images_with_questions(image_uris, questions))
 
 
 class CritiqueQuestion(BaseModel):
@@ -1047,49 +1785,79 @@ class CritiqueQuestion(BaseModel):
 class CritiqueQuestionList(BaseModel):
     questions: list[CritiqueQuestion] = Field(..., max_length=5, min_length=5)
 
+    def question_texts(self) -> list[str]:
+        return [q.question for q in self.questions]
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
+
+_CRITIQUE_QUESTIONS_SCHEMA = CritiqueQuestionList.model_json_schema()
+
+
+_CRITIQUE_QUESTIONS_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=_CRITIQUE_QUESTIONS_SCHEMA,
+    temperature=0.5,
 )
-def generate_critique_questions(
+
+
+@_gemini_retry
+async def agenerate_critique_questions(
     prompt: str, image_descriptions: list[str]
 ) -> list[str]:
     """Generates 5 yes/no questions based on a prompt and optional image descriptions."""
     model_name = cfg.MODEL_ID
-    config = types.GenerateContentConfig(
-        response_mime_type="application/json",
-        response_schema=CritiqueQuestionList.model_json_schema(),
-        temperature=0.5,
-    )
+
+    # The image descriptions are the exact-match scope; the prompt is
+    # compared semantically.
+    cache_scope = f"critique_questions:{model_name}:" + "|".join(image_descriptions)
+    embedding = None
+    if semantic_cache:
+        cached_text, embedding = await asyncio.to_thread(
+            semantic_cache.lookup, prompt, cache_scope
+        )
+        if cached_text:
+            analytics_logger.info("Critique questions semantic cache hit")
+            return CritiqueQuestionList.model_validate_json(cached_text).question_texts()
 
     if image_descriptions:
         meta_prompt = "Using the following prompt and the description of each image, come up with 5 yes/no questions that we could ask of the resulting image that would identify whether the generated images meets the intent of the user based upon the following:\n\n"
-        meta_prompt += f"Prompt: {prompt}\n\n"
-
-        for i, desc in enumerate(image_descriptions):
-            meta_prompt += f"Image {i + 1} description: {desc}\n"
+        meta_prompt += f"Prompt: {prompt}\n\n" + "".join(
+            f"Image {i + 1} description: {desc}\n"
+            for i, desc in enumerate(image_descriptions)
+        )
     else:
         meta_prompt = "Using the following prompt, come up with 5 yes/no questions that we could ask of a generated image to identify whether it meets the intent of the user:\n\n"
         meta_prompt += f"Prompt: {prompt}\n\n"
 
-    with track_model_call(model_name=model_name, task="generate_critique_questions"):
-        response = client.models.generate_content(
-            model=model_name, contents=[meta_prompt], config=config
-        )
+    response_text = await _agenerate_content_text(
+        model_name,
+        [meta_prompt],
+        _CRITIQUE_QUESTIONS_CONFIG,
+        task="generate_critique_questions",
+    )
+    question_list = CritiqueQuestionList.model_validate_json(response_text)
+    if semantic_cache:
+        semantic_cache.store(cache_scope, embedding, response_text)
+    return question_list.question_texts()
 
-    question_list = CritiqueQuestionList.model_validate_json(response.text)
-    return [q.question for q in question_list.questions]
 
+def generate_critique_questions(
+    prompt: str, image_descriptions: list[str]
+) -> list[str]:
+    """Generates 5 yes/no questions based on a prompt and optional image descriptions."""
+    return run_sync(agenerate_critique_questions(prompt, image_descriptions))
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
-)
+
+# File extension -> MIME type sent to Gemini by generate_text. Each media
+# kind maps to one general type.
+_MIME_TYPE_BY_EXTENSION = {
+    **dict.fromkeys((".mp4", ".mov", ".avi", ".mkv", ".webm"), "video/mp4"),
+    **dict.fromkeys((".wav", ".mp3", ".flac"), "audio/wav"),
+    **dict.fromkeys((".png", ".jpg", ".jpeg", ".webp", ".gif"), "image/png"),
+    ".pdf": "application/pdf",
+}
+
+
+@_gemini_retry
 def generate_text(
     prompt: str, images: list[str], model_name: Optional[str] = None
 ) -> tuple[str, float]:
@@ -1101,35 +1869,16 @@ def generate_text(
 
     parts = [types.Part.from_text(text=prompt)]
     for image_uri in images:
-        # More robust mime type detection
-        if any(
-            image_uri.lower().endswith(ext)
-            for ext in [".mp4", ".mov", ".avi", ".mkv", ".webm"]
-        ):
-            mime_type = "video/mp4"  # General video type
-        elif any(image_uri.lower().endswith(ext) for ext in [".wav", ".mp3", ".flac"]):
-            mime_type = "audio/wav"  # General audio type
-        elif any(
-            image_uri.lower().endswith(ext)
-            for ext in [".png", ".jpg", ".jpeg", ".webp", ".gif"]
-        ):
-            mime_type = "image/png"  # General image type
-        elif image_uri.lower().endswith(".pdf"):
-            mime_type = "application/pdf"
-        else:
-            # Fallback for unknown types, though this may still cause errors
-            mime_type = "application/octet-stream"
-
+        # Fallback for unknown types, though this may still cause errors
+        mime_type = _MIME_TYPE_BY_EXTENSION.get(
+            os.path.splitext(image_uri)[1].lower(), "application/octet-stream"
+        )
         parts.append(types.Part.from_uri(file_uri=image_uri, mime_type=mime_type))
 
     # print(f"Constructed parts for Gemini API: {parts}")
 
     contents = [types.Content(role="user", parts=parts)]
 
-    client = GeminiModelSetup.init(
-        location=cfg.LOCATION,
-    )
-
     # print(f"Sending request to model: {model_name}")
     with track_model_call(model_name=model_name, task="generate_text"):
         response = client.models.generate_content(
@@ -1158,43 +1907,53 @@ class TTSEvaluation(BaseModel):
     )
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    stop=stop_after_attempt(3),
-    retry=retry_if_exception_type(Exception),
-    reraise=True,
-)
-def evaluate_tts_audio(
-    audio_uri: str, original_text: str, generation_prompt: str
-) -> TTSEvaluation:
-    """Evaluate TTS audio using a specific prompt template."""
-    model_name = cfg.MODEL_ID
+_TTS_EVALUATION_SCHEMA = TTSEvaluation.model_json_schema()
 
-    base_prompt = GEMINI_TTS_EVALUATOR
 
-    # Replace placeholders
-    final_prompt = base_prompt.replace(
-        "[PASTE THE FULL TEXT THAT WAS CONVERTED TO SPEECH HERE]", original_text
+# The evaluator prompt with its placeholders turned into format fields once,
+# at import, rather than rescanned per call. Literal braces are escaped first.
+_TTS_EVALUATION_TEMPLATE = (
+    GEMINI_TTS_EVALUATOR.replace("{", "{{")
+    .replace("}", "}}")
+    .replace(
+        "[PASTE THE FULL TEXT THAT WAS CONVERTED TO SPEECH HERE]", "{original_text}"
     )
-    final_prompt = final_prompt.replace(
+    .replace(
         '[PASTE THE SPECIFIC PROMPT USED TO GENERATE THE AUDIO (e.g., "Narrate this in a friendly, slightly amused tone with a fast pace and a British accent.")]',
-        generation_prompt,
+        "{generation_prompt}",
     )
+)
 
-    config = types.GenerateContentConfig(
-        response_mime_type="application/json",
-        response_schema=TTSEvaluation.model_json_schema(),
-        temperature=0.2,  # Low temperature for consistent evaluation
-    )
+
+_TTS_EVALUATION_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=_TTS_EVALUATION_SCHEMA,
+    temperature=0.2,  # Low temperature for consistent evaluation
+)
+
+
+@_gemini_retry
+async def aevaluate_tts_audio(
+    audio_uri: str, original_text: str, generation_prompt: str
+) -> TTSEvaluation:
+    """Evaluate TTS audio using a specific prompt template."""
+    model_name = cfg.MODEL_ID
 
     prompt_parts = [
-        final_prompt,
+        _TTS_EVALUATION_TEMPLATE.format(
+            original_text=original_text, generation_prompt=generation_prompt
+        ),
         types.Part.from_uri(file_uri=audio_uri, mime_type="audio/wav"),
     ]
 
-    with track_model_call(model_name=model_name, task="evaluate_tts_audio"):
-        response = client.models.generate_content(
-            model=model_name, contents=prompt_parts, config=config
-        )
+    response_text = await _agenerate_content_text(
+        model_name, prompt_parts, _TTS_EVALUATION_CONFIG, task="evaluate_tts_audio"
+    )
+    return TTSEvaluation.model_validate_json(response_text)
+
 
-    return TTSEvaluation.model_validate_json(response.text)
+def evaluate_tts_audio(
+    audio_uri: str, original_text: str, generation_prompt: str
+) -> TTSEvaluation:
+    """Evaluate TTS audio using a specific prompt template."""
+    return run_sync(aevaluate_tts_audio(audio_uri, original_text, generation_prompt))
@@ -0,0 +1,140 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Exact-match response cache for deterministic Gemini calls."""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Protocol
+
+DEFAULT_TTL_SECONDS = 7 * 86400
+
+
+class CacheBackend(Protocol):
+    """Minimal key/value interface used by the Gemini response cache."""
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class InMemoryLRU:
+    """A thread-safe, per-process LRU cache with optional per-entry TTL."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[str, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisBackend:
+    """A shared cache backed by Redis, for multi-instance deployments.
+
+    Requires the optional `redis` package.
+    """
+
+    def __init__(self, url: str, prefix: str = "genmedia:gemini:"):
+        import redis  # Optional dependency, only needed when configured
+
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._client.get(self._prefix + key)
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        self._client.set(self._prefix + key, value, ex=ttl)
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self._prefix + key)
+
+
+def _normalize(value: Any) -> Any:
+    """Converts SDK objects into a JSON-serializable, order-stable structure."""
+    if hasattr(value, "model_dump"):
+        value = value.model_dump(exclude_none=True)
+    if isinstance(value, bytes):
+        # Hash inline media rather than embedding it in the key material.
+        return {"sha256": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def cache_key(model: str, contents: Any, config: Any = None) -> str:
+    """Builds a SHA-256 key from the model, request contents, and config.
+
+    The config carries the response schema and temperature, so requests that
+    differ in either produce different keys.
+    """
+    payload = {
+        "model": model,
+        "contents": _normalize(contents),
+        "config": _normalize(config),
+    }
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(config: Any, max_temperature: float) -> bool:
+    """Only near-deterministic requests (explicit, low temperature) are cached."""
+    temperature = getattr(config, "temperature", None)
+    return temperature is not None and temperature <= max_temperature
+
+
+def create_cache_backend(
+    maxsize: int = 512, redis_url: Optional[str] = None
+) -> CacheBackend:
+    """Returns a Redis backend when a URL is configured, else an in-memory LRU."""
+    if redis_url:
+        return RedisBackend(redis_url)
+    return InMemoryLRU(maxsize=maxsize)
@@ -0,0 +1,113 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Semantic (embedding similarity) cache for free-form Gemini prompts."""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EmbedFn = Callable[[list[str]], list[list[float]]]
+
+
+class _Bucket:
+    """Normalized embeddings and responses that share one scope."""
+
+    def __init__(self):
+        self.vectors: Optional[np.ndarray] = None
+        self.responses: list[str] = []
+
+
+class SemanticCache:
+    """Returns a cached response when a new prompt is a near-duplicate.
+
+    Entries are grouped by `scope`, an exact-match structural key (e.g. the
+    rewriter instructions, or the set of image URIs being critiqued). Only
+    prompts within the same scope are compared, by cosine similarity.
+    """
+
+    def __init__(
+        self,
+        embed_fn: EmbedFn,
+        threshold: float = 0.92,
+        max_scopes: int = 256,
+        max_entries_per_scope: int = 64,
+    ):
+        self._embed_fn = embed_fn
+        self.threshold = threshold
+        self.max_scopes = max_scopes
+        self.max_entries_per_scope = max_entries_per_scope
+        self._buckets: OrderedDict[str, _Bucket] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _scope_key(scope: str) -> str:
+        return hashlib.sha256(scope.encode("utf-8")).hexdigest()
+
+    def embed(self, text: str) -> Optional[np.ndarray]:
+        """Embeds and L2-normalizes `text`; returns None if embedding fails."""
+        try:
+            vector = np.asarray(self._embed_fn([text])[0], dtype=np.float32)
+        except Exception as e:
+            logger.warning("Semantic cache embedding failed: %s", e)
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def lookup(
+        self, text: str, scope: str
+    ) -> tuple[Optional[str], Optional[np.ndarray]]:
+        """Returns (cached_response, embedding) for `text` within `scope`.
+
+        The embedding is returned so a miss can be stored without re-embedding.
+        """
+        embedding = self.embed(text)
+        if embedding is None:
+            return None, None
+        with self._lock:
+            bucket = self._buckets.get(self._scope_key(scope))
+            if bucket is None or bucket.vectors is None:
+                return None, embedding
+            similarities = bucket.vectors @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                self._buckets.move_to_end(self._scope_key(scope))
+                return bucket.responses[best], embedding
+        return None, embedding
+
+    def store(self, scope: str, embedding: Optional[np.ndarray], response: str) -> None:
+        """Adds a response for a previously looked-up embedding."""
+        if embedding is None or not response:
+            return
+        key = self._scope_key(scope)
+        with self._lock:
+            bucket = self._buckets.setdefault(key, _Bucket())
+            self._buckets.move_to_end(key)
+            row = embedding[np.newaxis, :]
+            if bucket.vectors is None:
+                bucket.vectors = row
+            else:
+                bucket.vectors = np.vstack(
+                    (bucket.vectors, row)
+                )[-self.max_entries_per_scope :]
+            bucket.responses = (bucket.responses + [response])[
+                -self.max_entries_per_scope :
+            ]
+            while len(self._buckets) > self.max_scopes:
+                self._buckets.popitem(last=False)
@@ -14,7 +14,6 @@
 
 """Provides temporary handlers for the Shop The Look feature during refactoring."""
 
-import concurrent.futures
 import datetime
 import time
 from types import SimpleNamespace
@@ -24,11 +23,10 @@ import requests
 
 import models.shop_the_look_workflow as shop_the_look_workflow
 from common.metadata import MediaItem, add_media_item_to_firestore
-from common.storage import download_from_gcs
 from common.workflows import WorkflowStepResult
 from config.default import Default
 from models.gemini import (
-    describe_images_and_look,
+    describe_images_and_look_stream,
     final_image_critic,
     select_best_image_with_description,
 )
@@ -271,15 +269,10 @@ def on_click_vto_look(e: me.ClickEvent):  # pylint: disable=unused-argument
 
         articles = [row.clothing_image for row in look_articles]
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            if e.key != "retry":
-                desc_future = executor.submit(describe_images_and_look, look_articles)
-
-            article_image_bytes_list = list(executor.map(download_from_gcs, articles))
-
-            if e.key != "retry":
-                try:
-                    result = desc_future.result()
+        if e.key != "retry":
+            try:
+                # Article descriptions are shown as each one is generated.
+                for result in describe_images_and_look_stream(look_articles):
                     state.look_description = result.look_description
                     for item in state.articles:
                         for article in result.articles:
@@ -289,109 +282,95 @@ def on_click_vto_look(e: me.ClickEvent):  # pylint: disable=unused-argument
                             ):
                                 item.ai_description = article.article_description
                     yield
-                except Exception as exc:
-                    print(f"generated an exception: {exc}")
-
-                step_duration = time.time() - step_start_time
-                yield WorkflowStepResult(
-                    step_name="describe_product",
-                    status="complete",
-                    message="Look and article description generated",
-                    duration_seconds=step_duration,
-                    data={},
-                )
-
-            for i, row in enumerate(articles_for_vto):
-                state.current_status = f"{status_prefix}Trying on {row.article_type}..."
-                yield
-
-                potential_images = generate_vto_image(
-                    person_gcs_uri=state.reference_image_gcs_model,
-                    product_gcs_uri=row.clothing_image,
-                    sample_count=int(state.vto_sample_count),
-                )
-
-                temp_progressions = [
-                    ProgressionImage(image_path=p, best_image=False, reasoning="")
-                    for p in potential_images
-                ]
-
-                reference_image_bytes_list = list(
-                    executor.map(download_from_gcs, potential_images)
-                )
-
-                state.current_status = f"{status_prefix}Selecting best image of {row.article_type}..."
-                yield
-
-                byte_lookup = article_image_bytes_list[
-                    articles.index(row.clothing_image)
-                ]
-
-                best_match = select_best_image_with_description(
-                    [byte_lookup],
-                    reference_image_bytes_list,
-                    potential_images,
-                    f"a {row.article_type}",
-                    f"the {row.article_type}",
-                )
-
-                last_best_image = None
-                for p in temp_progressions:
-                    for bm in best_match.image_accuracy:
-                        if bm.article_image_path == p.image_path:
-                            p.best_image = bm.best_image
-                            p.reasoning = bm.reasoning
-                            p.accurate = bm.accurate
-                            if bm.best_image:
-                                last_best_image = p.image_path
-
-                if last_best_image is None and potential_images:
-                    # Fallback: if no 'best' image was flagged, use the last one generated.
-                    last_best_image = potential_images[-1]
-
-                progressions = ProgressionImages(progression_images=temp_progressions)
-
-                if e.key == "retry":
-                    state.retry_progression_images.append(progressions)
-                elif r.primary_view:
-                    state.progression_images.append(progressions)
-                else:
-                    state.alternate_progression_images.append(progressions)
+            except Exception as exc:
+                print(f"generated an exception: {exc}")
 
-                if r.primary_view and (i + 1) == len(articles_for_vto):
-                    state.result_image_gcs_uri = last_best_image
-                    state.result_image_display_url = create_display_url(last_best_image)
-                elif i == len(look_articles):
-                    state.alternate_gcs_uris.append(last_best_image)
-                    state.alternate_display_urls.append(create_display_url(last_best_image))
+            step_duration = time.time() - step_start_time
+            yield WorkflowStepResult(
+                step_name="describe_product",
+                status="complete",
+                message="Look and article description generated",
+                duration_seconds=step_duration,
+                data={},
+            )
 
-                state.reference_image_gcs_model = last_best_image
-                yield
+        for i, row in enumerate(articles_for_vto):
+            state.current_status = f"{status_prefix}Trying on {row.article_type}..."
+            yield
 
-    if e.key == "primary" or e.key == "retry":
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            final_image_bytes_list = list(
-                executor.map(download_from_gcs, [state.result_image_gcs_uri])
+            potential_images = generate_vto_image(
+                person_gcs_uri=state.reference_image_gcs_model,
+                product_gcs_uri=row.clothing_image,
+                sample_count=int(state.vto_sample_count),
             )
-            state.current_status = "Critic evaluation in progress..."
+
+            temp_progressions = [
+                ProgressionImage(image_path=p, best_image=False, reasoning="")
+                for p in potential_images
+            ]
+
+            state.current_status = f"{status_prefix}Selecting best image of {row.article_type}..."
             yield
-            final_critic = final_image_critic(
-                article_image_bytes_list,
-                articles,
-                final_image_bytes_list,
+
+            best_match = select_best_image_with_description(
+                [row.clothing_image],
+                potential_images,
+                f"a {row.article_type}",
+                f"the {row.article_type}",
             )
-            state.final_critic = final_critic
-            state.final_accuracy = final_critic.accurate
-            state.current_status = ""
+
+            last_best_image = None
+            for p in temp_progressions:
+                for bm in best_match.image_accuracy:
+                    if bm.article_image_path == p.image_path:
+                        p.best_image = bm.best_image
+                        p.reasoning = bm.reasoning
+                        p.accurate = bm.accurate
+                        if bm.best_image:
+                            last_best_image = p.image_path
+
+            if last_best_image is None and potential_images:
+                # Fallback: if no 'best' image was flagged, use the last one generated.
+                last_best_image = potential_images[-1]
+
+            progressions = ProgressionImages(progression_images=temp_progressions)
+
+            if e.key == "retry":
+                state.retry_progression_images.append(progressions)
+            elif r.primary_view:
+                state.progression_images.append(progressions)
+            else:
+                state.alternate_progression_images.append(progressions)
+
+            if r.primary_view and (i + 1) == len(articles_for_vto):
+                state.result_image_gcs_uri = last_best_image
+                state.result_image_display_url = create_display_url(last_best_image)
+            elif i == len(look_articles):
+                state.alternate_gcs_uris.append(last_best_image)
+                state.alternate_display_urls.append(create_display_url(last_best_image))
+
+            state.reference_image_gcs_model = last_best_image
             yield
 
-            if not state.final_critic.accurate and state.retry_counter < int(
-                state.max_retry
-            ):
-                new_event = SimpleNamespace(key="retry")
-                yield from on_click_vto_look(new_event)
-            elif state.generate_video:
-                yield from on_click_veo(e)
+    if e.key == "primary" or e.key == "retry":
+        state.current_status = "Critic evaluation in progress..."
+        yield
+        final_critic = final_image_critic(
+            articles,
+            [state.result_image_gcs_uri],
+        )
+        state.final_critic = final_critic
+        state.final_accuracy = final_critic.accurate
+        state.current_status = ""
+        yield
+
+        if not state.final_critic.accurate and state.retry_counter < int(
+            state.max_retry
+        ):
+            new_event = SimpleNamespace(key="retry")
+            yield from on_click_vto_look(new_event)
+        elif state.generate_video:
+            yield from on_click_veo(e)
 
     state.is_loading = False
     yield
@@ -42,8 +42,9 @@ from components.veo_button.veo_button import veo_button
 from config.default import Default as cfg
 from config.gemini_image_models import get_gemini_image_model_config
 from models.gemini import (
+    batch_evaluate_images_with_questions,
     describe_image,
-    evaluate_image_with_questions,
+    describe_images_as_completed,
     generate_critique_questions,
     generate_image_from_prompt_and_images,
     generate_transformation_prompts,
@@ -913,15 +914,15 @@ def on_upload(e: me.UploadEvent):
     # --- Step 2: Yield immediately to update UI with placeholders ---
     yield
 
-    # --- Step 3: Generate descriptions for the new images ---
-    for index in new_upload_indices:
-        gcs_url = state.uploaded_image_gcs_uris[index]
-        try:
-            description = describe_image(gcs_url)
-            state.image_descriptions[index] = description
-        except Exception as ex:
-            print(f"ERROR: Failed to describe image {gcs_url}. Details: {ex}")
+    # --- Step 3: Generate descriptions for the new images concurrently ---
+    new_gcs_urls = [state.uploaded_image_gcs_uris[index] for index in new_upload_indices]
+    for i, description in describe_images_as_completed(new_gcs_urls):
+        index = new_upload_indices[i]
+        if isinstance(description, BaseException):
+            print(f"ERROR: Failed to describe image {new_gcs_urls[i]}. Details: {description}")
             state.image_descriptions[index] = "Failed to generate description."
+        else:
+            state.image_descriptions[index] = description
 
         # Yield after each description is generated to update the UI incrementally
         yield
@@ -1291,11 +1292,14 @@ def _generate_and_save(base_prompt: str, input_gcs_uris: list[str]):
                 state.is_evaluating = True
                 yield
 
+                evaluation_results = batch_evaluate_images_with_questions(
+                    image_uris=gcs_uris, questions=state.critique_questions
+                )
                 for uri in gcs_uris:
                     try:
-                        evaluation_result = evaluate_image_with_questions(
-                            image_uri=uri, questions=state.critique_questions
-                        )
+                        evaluation_result = evaluation_results.get(uri)
+                        if evaluation_result is None:
+                            raise ValueError("No evaluation returned for image.")
 
                         # Process results
                         yes_answers = sum(
@@ -13,8 +13,11 @@
 # limitations under the License.
 """Gemini Writers Workshop - an experimental page for text generation."""
 
-import json
+import concurrent.futures
+import functools
+import os
 import time
+import uuid
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -28,6 +31,7 @@ from components.copy_button.copy_button import copy_button
 from components.dialog import dialog
 from components.header import header
 from components.image_thumbnail import image_thumbnail
+from components.interval_timer.interval_timer import interval_timer
 from components.library.events import LibrarySelectionChangeEvent
 from components.library.library_chooser_button import library_chooser_button
 from components.page_scaffold import page_frame, page_scaffold
@@ -42,14 +46,61 @@ from models.gemini import generate_text
 from state.state import AppState
 
 MAX_MEDIA_ASSETS = 3
+TEXT_TEMPLATES_PATH = "config/text_prompt_templates.json"
+# User templates live in Firestore and may be added from other pages, so the
+# shared template cache is also refreshed on this interval.
+_TEMPLATE_CACHE_TTL_SECONDS = 60
+
+# Uploads to GCS run here, off the request thread. on_upload only submits them;
+# on_upload_poll picks up finished ones on later timer ticks.
+_UPLOAD_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="writers-workshop-upload"
+)
+# In-flight uploads by MediaAsset.upload_id, as (file name, future).
+_pending_uploads: dict[str, tuple[str, concurrent.futures.Future]] = {}
+_UPLOAD_POLL_INTERVAL_MS = 500
+
+ACCEPTED_UPLOAD_TYPES = (
+    "image/jpeg",
+    "image/png",
+    "image/webp",
+    "video/mp4",
+    "application/pdf",
+)
+_IMAGE_EXTENSIONS = frozenset({"png", "jpg", "jpeg", "webp", "gif"})
+_VIDEO_EXTENSIONS = frozenset({"mp4", "mov", "avi", "webm"})
+
+
+def _media_kind(gcs_uri: str) -> str:
+    """Returns "image", "video", "pdf" or "other" based on the URI's extension.
+
+    Slots whose upload is still in progress have the kind "uploading".
+    """
+    extension = gcs_uri.rpartition(".")[2].lower()
+    if extension in _IMAGE_EXTENSIONS:
+        return "image"
+    if extension in _VIDEO_EXTENSIONS:
+        return "video"
+    if extension == "pdf":
+        return "pdf"
+    return "other"
+
+
+@dataclass
+class MediaAsset:
+    """A media asset attached to the prompt."""
+
+    gcs_uri: str = ""
+    display_url: str = ""
+    kind: str = ""  # See _media_kind
+    upload_id: str = ""  # Key into _pending_uploads while kind is "uploading"
 
 
 @me.stateclass
 class PageState:
     """Gemini Writers Workshop Page State"""
 
-    uploaded_media_gcs_uris: list[str] = field(default_factory=list)  # pylint: disable=E3701:invalid-field-call
-    uploaded_media_display_urls: list[str] = field(default_factory=list)  # pylint: disable=E3701:invalid-field-call
+    uploaded_media: list[MediaAsset] = field(default_factory=list)  # pylint: disable=E3701:invalid-field-call
     prompt: str = ""
     generated_text: str = ""
     is_generating: bool = False
@@ -59,6 +110,8 @@ class PageState:
     snackbar_message: str = ""
     previous_media_item_id: str | None = None
     prompt_templates: list[dict] = field(default_factory=list)  # pylint: disable=E3701:invalid-field-call
+    # prompt_templates grouped by lower-cased category, built when templates load
+    prompt_template_categories: dict[str, list[dict]] = field(default_factory=dict)  # pylint: disable=E3701:invalid-field-call
     selected_model: str = ""
 
     info_dialog_open: bool = False
@@ -67,17 +120,16 @@ class PageState:
     show_save_template_dialog: bool = False
 
 
-with open("config/about_content.json", "r") as f:
-    about_content = json.load(f)
-    WRITERS_WORKSHOP_INFO = {
-        "title": "Gemini Writers Workshop",
-        "description": "A place to generate text content from prompts and optional media assets.\n\nUpload an image or video to get a Gemini description, or upload a PDF to extract or analyze information. Use this information to enhance your understanding and create new prompts.",
-    }
+WRITERS_WORKSHOP_INFO = {
+    "title": "Gemini Writers Workshop",
+    "description": "A place to generate text content from prompts and optional media assets.\n\nUpload an image or video to get a Gemini description, or upload a PDF to extract or analyze information. Use this information to enhance your understanding and create new prompts.",
+}
 
 
 def open_info_dialog(e: me.ClickEvent):
     """Open the info dialog."""
     state = me.state(PageState)
+    state.show_snackbar = False
     state.info_dialog_open = True
     yield
 
@@ -85,24 +137,61 @@ def open_info_dialog(e: me.ClickEvent):
 def close_info_dialog(e: me.ClickEvent):
     """Close the info dialog."""
     state = me.state(PageState)
+    state.show_snackbar = False
     state.info_dialog_open = False
     yield
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_template_dicts(
+    config_path: str, template_type: str, mtime: Optional[float], ttl_bucket: int
+) -> tuple[dict, ...]:
+    templates = prompt_template_service.load_templates(
+        config_path=config_path, template_type=template_type
+    )
+    return tuple(t.model_dump() for t in templates)
+
+
+def _load_template_dicts(config_path: str, template_type: str) -> list[dict]:
+    """Returns templates as dicts, shared across sessions.
+
+    The cache is keyed on the JSON file's mtime so edits to the defaults are
+    picked up, and on a TTL bucket so Firestore templates do not go stale.
+    """
+    try:
+        mtime = os.path.getmtime(config_path)
+    except OSError:
+        mtime = None
+    ttl_bucket = int(time.monotonic() // _TEMPLATE_CACHE_TTL_SECONDS)
+    return [
+        dict(t)
+        for t in _cached_template_dicts(config_path, template_type, mtime, ttl_bucket)
+    ]
+
+
+def _group_templates_by_category(templates: list[dict]) -> dict[str, list[dict]]:
+    """Groups template dicts by category (case-insensitive)."""
+    categories = {}
+    for t in templates:
+        categories.setdefault(t["category"].lower(), []).append(t)
+    return categories
+
+
 def on_load(e: me.LoadEvent):
     state = me.state(PageState)
     if not state.selected_model:
         state.selected_model = cfg().GEMINI_WRITERS_WORKSHOP_MODEL_ID
     if not state.prompt_templates:
-        templates = prompt_template_service.load_templates(
-            config_path="config/text_prompt_templates.json", template_type="text"
+        state.prompt_templates = _load_template_dicts(TEXT_TEMPLATES_PATH, "text")
+        state.prompt_template_categories = _group_templates_by_category(
+            state.prompt_templates
         )
-        state.prompt_templates = [t.model_dump() for t in templates]
     yield
 
 
 def on_model_selection_change(e: me.SelectSelectionChangeEvent):
     state = me.state(PageState)
+    state.show_snackbar = False
     state.selected_model = e.value
     yield
 
@@ -115,6 +204,7 @@ def on_template_click(e: me.ClickEvent):
     with the template's content.
     """
     state = me.state(PageState)
+    state.show_snackbar = False
 
     template_prompt = e.key
 
@@ -131,7 +221,9 @@ def on_template_click(e: me.ClickEvent):
 
         yield from _generate_text_and_save(
             base_prompt=combined_prompt,
-            input_gcs_uris=state.uploaded_media_gcs_uris,
+            input_gcs_uris=[
+                asset.gcs_uri for asset in state.uploaded_media if asset.gcs_uri
+            ],
         )
 
     else:
@@ -145,6 +237,8 @@ def on_template_click(e: me.ClickEvent):
 def on_open_save_dialog_click(e: me.ClickEvent):
     state = me.state(PageState)
 
+    state.show_snackbar = False
+
     state.show_save_template_dialog = True
 
     yield
@@ -153,6 +247,8 @@ def on_open_save_dialog_click(e: me.ClickEvent):
 def on_close_save_dialog(e: me.ClickEvent):
     state = me.state(PageState)
 
+    state.show_snackbar = False
+
     state.show_save_template_dialog = False
 
     yield
@@ -161,6 +257,8 @@ def on_close_save_dialog(e: me.ClickEvent):
 def on_save_template(label: str, key: str, category: str, prompt: str):
     state = me.state(PageState)
 
+    state.show_snackbar = False
+
     app_state = me.state(AppState)
 
     new_template = PromptTemplate(
@@ -173,22 +271,24 @@ def on_save_template(label: str, key: str, category: str, prompt: str):
     )
 
     try:
-        prompt_template_service.add_template(new_template)
-
-        # Reload templates
-
-        templates = prompt_template_service.load_templates(
-            config_path="config/text_prompt_templates.json", template_type="text"
+        saved = prompt_template_service.add_template(new_template).model_dump()
+
+        # Add the saved template locally rather than reloading every template.
+        # It replaces any template with the same key, as load_templates would.
+        state.prompt_templates = [
+            t for t in state.prompt_templates if t["key"] != saved["key"]
+        ] + [saved]
+        state.prompt_template_categories = _group_templates_by_category(
+            state.prompt_templates
         )
 
-        state.prompt_templates = [t.model_dump() for t in templates]
+        # Other sessions pick the new template up on their next load
+        _cached_template_dicts.cache_clear()
 
         # Close dialog
 
         state.show_save_template_dialog = False
 
-        yield from show_snackbar("Template saved successfully!")
-
     except Exception as e:
         print(f"Error saving template: {e}")
 
@@ -196,7 +296,11 @@ def on_save_template(label: str, key: str, category: str, prompt: str):
 
         state.show_error_dialog = True
 
-    yield
+        yield
+        return
+
+    # The snackbar's yield also renders the closed dialog and new template.
+    yield from show_snackbar("Template saved successfully!")
 
 
 CHIP_STYLE = me.Style(
@@ -206,19 +310,65 @@ CHIP_STYLE = me.Style(
     height=32,
 )
 
+# Invariant styles for the media upload slots, built once rather than per render.
+MEDIA_SLOT_STYLE = me.Style(position="relative", width=100, height=100)
+MEDIA_IMAGE_STYLE = me.Style(
+    width="100%",
+    height="100%",
+    border_radius=8,
+    object_fit="cover",
+)
+DOCUMENT_TILE_STYLE = me.Style(
+    width=100,
+    height=100,
+    border=me.Border.all(me.BorderSide(style="dashed")),
+    display="flex",
+    align_items="center",
+    justify_content="center",
+)
+REMOVE_MEDIA_BADGE_STYLE = me.Style(
+    background="rgba(0, 0, 0, 0.5)",
+    color="white",
+    position="absolute",
+    top=4,
+    right=4,
+    border_radius="50%",
+    cursor="pointer",
+    display="flex",
+    align_items="center",
+    justify_content="center",
+    width=26,
+    height=26,
+)
+REMOVE_MEDIA_ICON_STYLE = me.Style(font_size=18)
+DASHED_OUTLINE_BORDER = me.Border.all(
+    me.BorderSide(width=1, style="dashed", color=me.theme_var("outline"))
+)
+UPLOADER_PLACEHOLDER_STYLE = me.Style(
+    height=100,
+    width=100,
+    border=DASHED_OUTLINE_BORDER,
+    border_radius=8,
+    display="flex",
+    flex_direction="column",
+    align_items="center",
+    justify_content="center",
+    gap=8,
+)
+EMPTY_PLACEHOLDER_STYLE = me.Style(
+    height=100,
+    width=100,
+    border=DASHED_OUTLINE_BORDER,
+    border_radius=8,
+    opacity=0.5,
+)
+
 
 @me.component
 def _prompt_templates_ui():
     state = me.state(PageState)
 
-    # Group templates by category (case-insensitive)
-    categories = {}
-    for t in state.prompt_templates:
-        category_key = t["category"].lower()
-        if category_key not in categories:
-            categories[category_key] = []
-        categories[category_key].append(t)
-
+    categories = state.prompt_template_categories
     if not categories:
         return
 
@@ -307,6 +457,8 @@ def gemini_writers_workshop_page_content():
         ):
             me.button("Close", on_click=on_close_error_dialog, type="flat")
 
+    snackbar(is_visible=state.show_snackbar, label=state.snackbar_message)
+
     with page_frame():  # pylint: disable=E1129:not-context-manager
         header(
             "Gemini Writers Workshop",
@@ -334,7 +486,7 @@ def gemini_writers_workshop_page_content():
                     max_rows=20,
                     autosize=True,
                     on_blur=on_prompt_blur,
-                    value=me.state(PageState).prompt,
+                    value=state.prompt,
                     style=me.Style(width="100%", margin=me.Margin(bottom=2)),
                     appearance="outline",
                 )
@@ -384,12 +536,9 @@ def gemini_writers_workshop_page_content():
                         ):
                             me.icon("save")
 
-                if (
-                    me.state(PageState).generation_complete
-                    and me.state(PageState).generation_time > 0
-                ):
+                if state.generation_complete and state.generation_time > 0:
                     me.text(
-                        f"{me.state(PageState).generation_time:.2f} seconds",
+                        f"{state.generation_time:.2f} seconds",
                         style=me.Style(font_size=12),
                     )
 
@@ -404,7 +553,7 @@ def gemini_writers_workshop_page_content():
                     min_height=400,
                 )
             ):
-                if me.state(PageState).generated_text:
+                if state.generated_text:
                     with me.box(
                         style=me.Style(
                             display="flex",
@@ -414,9 +563,9 @@ def gemini_writers_workshop_page_content():
                         )
                     ):
                         me.text("Generated Text", type="headline-6")
-                        copy_button(text_to_copy=me.state(PageState).generated_text)
+                        copy_button(text_to_copy=state.generated_text)
                     me.markdown(
-                        me.state(PageState).generated_text,
+                        state.generated_text,
                         style=me.Style(margin=me.Margin(top=16)),
                     )
                 else:
@@ -444,6 +593,12 @@ def gemini_writers_workshop_page_content():
 def _media_upload_slots():
     """The media upload UI with 3 slots."""
     state = me.state(PageState)
+    if any(asset.kind == "uploading" for asset in state.uploaded_media):
+        interval_timer(
+            on_tick=on_upload_poll,
+            interval_ms=_UPLOAD_POLL_INTERVAL_MS,
+            key="upload_poll",
+        )
     with me.box(
         style=me.Style(
             display="flex",
@@ -454,75 +609,33 @@ def _media_upload_slots():
         )
     ):
         for i in range(MAX_MEDIA_ASSETS):
-            if i < len(state.uploaded_media_display_urls):
-                display_url = state.uploaded_media_display_urls[i]
-                gcs_uri = state.uploaded_media_gcs_uris[i]
-
-                with me.box(style=me.Style(position="relative", width=100, height=100)):
-                    if any(
-                        gcs_uri.lower().endswith(ext)
-                        for ext in [".png", ".jpg", ".jpeg", ".webp", ".gif"]
-                    ):
-                        me.image(
-                            src=display_url,
-                            style=me.Style(
-                                width="100%",
-                                height="100%",
-                                border_radius=8,
-                                object_fit="cover",
-                            ),
-                        )
-                    elif any(
-                        gcs_uri.lower().endswith(ext)
-                        for ext in [".mp4", ".mov", ".avi", ".webm"]
-                    ):
+            if i < len(state.uploaded_media):
+                display_url = state.uploaded_media[i].display_url
+                media_kind = state.uploaded_media[i].kind
+
+                with me.box(style=MEDIA_SLOT_STYLE):
+                    if media_kind == "uploading":
+                        with me.box(style=DOCUMENT_TILE_STYLE):
+                            me.progress_spinner(diameter=32, stroke_width=3)
+                    elif media_kind == "image":
+                        me.image(src=display_url, style=MEDIA_IMAGE_STYLE)
+                    elif media_kind == "video":
                         video_thumbnail(video_src=display_url)
-                    elif gcs_uri.lower().endswith(".pdf"):
-                        with me.box(
-                            style=me.Style(
-                                width=100,
-                                height=100,
-                                border=me.Border.all(me.BorderSide(style="dashed")),
-                                display="flex",
-                                align_items="center",
-                                justify_content="center",
-                            )
-                        ):
+                    elif media_kind == "pdf":
+                        with me.box(style=DOCUMENT_TILE_STYLE):
                             me.icon("article")
                     else:
-                        with me.box(
-                            style=me.Style(
-                                width=100,
-                                height=100,
-                                border=me.Border.all(me.BorderSide(style="dashed")),
-                                display="flex",
-                                align_items="center",
-                                justify_content="center",
-                            )
-                        ):
+                        with me.box(style=DOCUMENT_TILE_STYLE):
                             me.icon("article")
 
                     with me.box(
                         on_click=on_remove_media,
                         key=str(i),
-                        style=me.Style(
-                            background="rgba(0, 0, 0, 0.5)",
-                            color="white",
-                            position="absolute",
-                            top=4,
-                            right=4,
-                            border_radius="50%",
-                            cursor="pointer",
-                            display="flex",
-                            align_items="center",
-                            justify_content="center",
-                            width=26,
-                            height=26,
-                        ),
+                        style=REMOVE_MEDIA_BADGE_STYLE,
                     ):
-                        me.icon("close", style=me.Style(font_size=18))
+                        me.icon("close", style=REMOVE_MEDIA_ICON_STYLE)
 
-            elif i == len(state.uploaded_media_gcs_uris):
+            elif i == len(state.uploaded_media):
                 _uploader_placeholder(key_prefix=f"media_slot_{i}")
             else:
                 _empty_placeholder()
@@ -531,35 +644,11 @@ def _media_upload_slots():
 @me.component
 def _uploader_placeholder(key_prefix: str):
     """A placeholder box with uploader and library chooser buttons."""
-    with me.box(
-        style=me.Style(
-            height=100,
-            width=100,
-            border=me.Border.all(
-                me.BorderSide(
-                    width=1,
-                    style="dashed",
-                    color=me.theme_var("outline"),
-                )
-            ),
-            border_radius=8,
-            display="flex",
-            flex_direction="column",
-            align_items="center",
-            justify_content="center",
-            gap=8,
-        )
-    ):
+    with me.box(style=UPLOADER_PLACEHOLDER_STYLE):
         me.uploader(
             label="Upload Media",
             on_upload=on_upload,
-            accepted_file_types=[
-                "image/jpeg",
-                "image/png",
-                "image/webp",
-                "video/mp4",
-                "application/pdf",
-            ],
+            accepted_file_types=ACCEPTED_UPLOAD_TYPES,
             key=f"{key_prefix}_uploader",
             multiple=True,
         )
@@ -574,17 +663,7 @@ def _uploader_placeholder(key_prefix: str):
 @me.component
 def _empty_placeholder():
     """An empty, non-interactive placeholder box."""
-    me.box(
-        style=me.Style(
-            height=100,
-            width=100,
-            border=me.Border.all(
-                me.BorderSide(width=1, style="dashed", color=me.theme_var("outline"))
-            ),
-            border_radius=8,
-            opacity=0.5,
-        )
-    )
+    me.box(style=EMPTY_PLACEHOLDER_STYLE)
 
 
 @me.component
@@ -614,10 +693,16 @@ def _generate_text_button():
 def on_media_select(e: LibrarySelectionChangeEvent):
     """Handles media selection from the library chooser."""
     state = me.state(PageState)
+    state.show_snackbar = False
     gcs_uri = e.gcs_uri
-    if len(state.uploaded_media_gcs_uris) < MAX_MEDIA_ASSETS:
-        state.uploaded_media_gcs_uris.append(gcs_uri)
-        state.uploaded_media_display_urls.append(create_display_url(gcs_uri))
+    if len(state.uploaded_media) < MAX_MEDIA_ASSETS:
+        state.uploaded_media.append(
+            MediaAsset(
+                gcs_uri=gcs_uri,
+                display_url=create_display_url(gcs_uri),
+                kind=_media_kind(gcs_uri),
+            )
+        )
     else:
         yield from show_snackbar(f"You can add a maximum of {MAX_MEDIA_ASSETS} media assets.")
     yield
@@ -626,27 +711,83 @@ def on_media_select(e: LibrarySelectionChangeEvent):
 # Other event handlers
 def on_upload(e: me.UploadEvent):
     state = me.state(PageState)
-    if len(state.uploaded_media_gcs_uris) < MAX_MEDIA_ASSETS:
-        file = e.files[0]
-        gcs_url = store_to_gcs(
-            "gemini_writers_studio_references",
-            file.name,
-            file.mime_type,
-            file.getvalue(),
-        )
-        state.uploaded_media_gcs_uris.append(gcs_url)
-        state.uploaded_media_display_urls.append(create_display_url(gcs_url))
+    state.show_snackbar = False
+    remaining = MAX_MEDIA_ASSETS - len(state.uploaded_media)
+    if remaining > 0:
+        # Show an "uploading" slot per file and return; on_upload_poll fills
+        # the slots in as the uploads finish.
+        for file in e.files[:remaining]:
+            upload_id = uuid.uuid4().hex
+            _pending_uploads[upload_id] = (
+                file.name,
+                _UPLOAD_EXECUTOR.submit(
+                    store_to_gcs,
+                    "gemini_writers_studio_references",
+                    file.name,
+                    file.mime_type,
+                    file.getvalue(),
+                ),
+            )
+            state.uploaded_media.append(
+                MediaAsset(kind="uploading", upload_id=upload_id)
+            )
+        if len(e.files) > remaining:
+            yield from show_snackbar(
+                f"You can add a maximum of {MAX_MEDIA_ASSETS} media assets."
+            )
     else:
-        show_snackbar(f"You can add a maximum of {MAX_MEDIA_ASSETS} media assets.")
+        yield from show_snackbar(
+            f"You can add a maximum of {MAX_MEDIA_ASSETS} media assets."
+        )
     yield
 
 
+def on_upload_poll(e: me.WebEvent):
+    """Fills in the "uploading" slots whose uploads have finished.
+
+    Runs on interval_timer ticks, not user actions, so it leaves the snackbar
+    alone.
+    """
+    state = me.state(PageState)
+    remaining_media = []
+    for asset in state.uploaded_media:
+        pending = _pending_uploads.get(asset.upload_id)
+        if asset.kind != "uploading" or pending is None or not pending[1].done():
+            remaining_media.append(asset)
+            continue
+        del _pending_uploads[asset.upload_id]
+        file_name, future = pending
+        try:
+            gcs_url = future.result()
+        except Exception as ex:
+            print(f"ERROR: Failed to upload {file_name}. Details: {ex}")
+            state.error_message = f"Error uploading {file_name}: {ex}"
+            state.show_error_dialog = True
+            continue
+        remaining_media.append(
+            MediaAsset(
+                gcs_uri=gcs_url,
+                display_url=create_display_url(gcs_url),
+                kind=_media_kind(gcs_url),
+            )
+        )
+    state.uploaded_media = remaining_media
+    yield
+
+
+def _discard_pending_upload(asset: MediaAsset):
+    """Forgets an in-flight upload whose slot was removed."""
+    if asset.upload_id:
+        _pending_uploads.pop(asset.upload_id, None)
+
+
 def on_remove_media(e: me.ClickEvent):
     state = me.state(PageState)
+    state.show_snackbar = False
     index_to_remove = int(e.key)
-    if 0 <= index_to_remove < len(state.uploaded_media_gcs_uris):
-        del state.uploaded_media_gcs_uris[index_to_remove]
-        del state.uploaded_media_display_urls[index_to_remove]
+    if 0 <= index_to_remove < len(state.uploaded_media):
+        _discard_pending_upload(state.uploaded_media[index_to_remove])
+        del state.uploaded_media[index_to_remove]
     yield
 
 
@@ -657,10 +798,12 @@ def on_prompt_blur(e: me.InputEvent):
 @track_click(element_id="writers_workshop_clear_button")
 def on_clear_click(e: me.ClickEvent):
     state = me.state(PageState)
+    state.show_snackbar = False
     state.generated_text = ""
     state.prompt = ""
-    state.uploaded_media_gcs_uris = []
-    state.uploaded_media_display_urls = []
+    for asset in state.uploaded_media:
+        _discard_pending_upload(asset)
+    state.uploaded_media = []
     state.generation_time = 0.0
     state.generation_complete = False
     state.previous_media_item_id = None
@@ -668,29 +811,35 @@ def on_clear_click(e: me.ClickEvent):
 
 
 def show_snackbar(message: str):
+    """Shows a snackbar message until the user's next action.
+
+    Every event handler on this page clears it on entry, so the message stays
+    until the next action instead of sleeping on the request thread to hide it.
+    """
     state = me.state(PageState)
     state.snackbar_message = message
     state.show_snackbar = True
     yield
-    time.sleep(3)
-    state.show_snackbar = False
-    yield
 
 
 @track_click(element_id="writers_workshop_generate_button")
 def on_generate_text_click(e: me.ClickEvent):
     state = me.state(PageState)
+    state.show_snackbar = False
     if not state.prompt:
         yield from show_snackbar("Please enter a prompt.")
         return
     yield from _generate_text_and_save(
         base_prompt=state.prompt,
-        input_gcs_uris=state.uploaded_media_gcs_uris,
+        input_gcs_uris=[
+            asset.gcs_uri for asset in state.uploaded_media if asset.gcs_uri
+        ],
     )
 
 
 def on_close_error_dialog(e: me.ClickEvent):
     state = me.state(PageState)
+    state.show_snackbar = False
     state.show_error_dialog = False
     yield
 
@@ -0,0 +1,73 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.llm_cache import InMemoryLRU, cache_key, is_cacheable
+
+
+def test_cache_key_is_stable_and_sensitive_to_inputs():
+    """Identical requests share a key; any change to model, contents or config does not."""
+    config = {"temperature": 0.1, "response_schema": {"b": 1, "a": 2}}
+    reordered = {"response_schema": {"a": 2, "b": 1}, "temperature": 0.1}
+
+    key = cache_key("gemini-2.5-flash", ["prompt", b"image-bytes"], config)
+
+    assert key == cache_key("gemini-2.5-flash", ["prompt", b"image-bytes"], reordered)
+    assert key != cache_key("gemini-2.5-pro", ["prompt", b"image-bytes"], config)
+    assert key != cache_key("gemini-2.5-flash", ["prompt", b"other-bytes"], config)
+    assert key != cache_key(
+        "gemini-2.5-flash", ["prompt", b"image-bytes"], {**config, "temperature": 0.2}
+    )
+
+
+def test_in_memory_lru_evicts_least_recently_used():
+    """The oldest untouched entry is evicted once the cache is full."""
+    cache = InMemoryLRU(maxsize=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"  # "a" is now most recently used
+
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+    cache.delete("a")
+    assert cache.get("a") is None
+
+
+def test_in_memory_lru_expires_entries(monkeypatch):
+    """Entries are dropped once their TTL has elapsed."""
+    now = [1000.0]
+    monkeypatch.setattr("models.llm_cache.time.monotonic", lambda: now[0])
+    cache = InMemoryLRU()
+    cache.set("key", "value", ttl=10)
+
+    assert cache.get("key") == "value"
+    now[0] += 11
+    assert cache.get("key") is None
+
+
+def test_is_cacheable_requires_low_explicit_temperature():
+    """Requests without a temperature, or above the threshold, bypass the cache."""
+    assert is_cacheable(SimpleNamespace(temperature=0.1), max_temperature=0.3)
+    assert not is_cacheable(SimpleNamespace(temperature=0.8), max_temperature=0.3)
+    assert not is_cacheable(SimpleNamespace(temperature=None), max_temperature=0.3)
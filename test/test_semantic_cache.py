@@ -0,0 +1,69 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from models.semantic_cache import SemanticCache
+
+# Toy embeddings: the two "cat" prompts are near-duplicates, "dog" is not.
+FAKE_EMBEDDINGS = {
+    "a cat on a sofa": [1.0, 0.0, 0.0],
+    "a cat on the sofa": [0.99, 0.05, 0.0],
+    "a dog in the park": [0.0, 1.0, 0.0],
+}
+
+
+def fake_embed(texts):
+    return [FAKE_EMBEDDINGS[t] for t in texts]
+
+
+def test_near_duplicate_prompt_hits_within_scope():
+    """A semantically similar prompt in the same scope returns the cached response."""
+    cache = SemanticCache(fake_embed, threshold=0.92)
+    hit, embedding = cache.lookup("a cat on a sofa", scope="rewriter")
+    assert hit is None
+    cache.store("rewriter", embedding, "rewritten cat prompt")
+
+    hit, _ = cache.lookup("a cat on the sofa", scope="rewriter")
+    assert hit == "rewritten cat prompt"
+
+    # Different prompt, or same prompt in a different scope, is a miss.
+    assert cache.lookup("a dog in the park", scope="rewriter")[0] is None
+    assert cache.lookup("a cat on the sofa", scope="image_critique:gs://a")[0] is None
+
+
+def test_embedding_failure_is_a_miss():
+    """Errors from the embedding model never break the caller."""
+
+    def failing_embed(texts):
+        raise RuntimeError("quota exceeded")
+
+    cache = SemanticCache(failing_embed)
+    assert cache.lookup("a cat on a sofa", scope="rewriter") == (None, None)
+    cache.store("rewriter", None, "ignored")
+
+
+def test_scopes_are_bounded():
+    """The least recently used scope is evicted once max_scopes is exceeded."""
+    cache = SemanticCache(fake_embed, max_scopes=1)
+    _, embedding = cache.lookup("a cat on a sofa", scope="first")
+    cache.store("first", embedding, "first response")
+    cache.store("second", embedding, "second response")
+
+    assert cache.lookup("a cat on a sofa", scope="first")[0] is None
+    assert cache.lookup("a cat on a sofa", scope="second")[0] == "second response"
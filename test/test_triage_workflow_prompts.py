@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import json
 import os
 import pytest
@@ -75,6 +76,12 @@ MOCK_LABELS = [
     "status/needs-triage"
 ]
 
+# The inputs are constant, so the full prompt (with simulated environment
+# variables) is built once.
+_MOCK_ISSUES_JSON = json.dumps(MOCK_ISSUES)
+_MOCK_LABELS_CSV = ",".join(MOCK_LABELS)
+_FULL_PROMPT = PROMPT_TEMPLATE + f"\n\n[SIMULATED ENV VARS]\nISSUES_TO_TRIAGE={_MOCK_ISSUES_JSON}\nAVAILABLE_LABELS={_MOCK_LABELS_CSV}\n"
+
 @pytest.fixture(scope="module")
 def gemini_client():
     """Initializes the Gemini client for testing."""
@@ -90,25 +97,32 @@ def gemini_client():
         location=location,
     )
 
-@pytest.mark.parametrize("iteration", range(5))
-def test_triage_prompt_no_markdown(gemini_client, iteration):
+ITERATIONS = 5
+
+
+def test_triage_prompt_no_markdown(gemini_client):
     """
     Tests that the triage prompt produces valid JSON without markdown formatting.
-    Running multiple iterations to ensure consistency.
+    Running multiple iterations concurrently to ensure consistency.
     """
     model_id = os.environ.get("GEMINI_MODEL", "gemini-2.5-flash")
-    
-    # Construct the full prompt with simulated environment variables
-    full_prompt = PROMPT_TEMPLATE + f"\n\n[SIMULATED ENV VARS]\nISSUES_TO_TRIAGE={json.dumps(MOCK_ISSUES)}\nAVAILABLE_LABELS={','.join(MOCK_LABELS)}\n"
-    
-    try:
-        response = gemini_client.models.generate_content(
+
+    def generate(_):
+        return gemini_client.models.generate_content(
             model=model_id,
-            contents=full_prompt,
+            contents=_FULL_PROMPT,
             config=types.GenerateContentConfig(
                 temperature=0.1
             )
         )
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=ITERATIONS) as executor:
+            responses = list(executor.map(generate, range(ITERATIONS)))
+    except Exception as e:
+        pytest.fail(f"Gemini API call failed: {e}")
+
+    for iteration, response in enumerate(responses):
         output = response.text
         
         # Assertion 1: Check for markdown code blocks
@@ -117,12 +131,9 @@ def test_triage_prompt_no_markdown(gemini_client, iteration):
         # Assertion 2: Check for valid JSON
         try:
             parsed_json = json.loads(output)
-            assert isinstance(parsed_json, list), "Output JSON should be a list"
-            if parsed_json:
-                assert "issue_number" in parsed_json[0], "JSON objects should have 'issue_number'"
-                assert "labels_to_set" in parsed_json[0], "JSON objects should have 'labels_to_set'"
         except json.JSONDecodeError as e:
             pytest.fail(f"Output was not valid JSON (Iteration {iteration}): {e}\nOutput:\n{output}")
-            
-    except Exception as e:
-        pytest.fail(f"Gemini API call failed: {e}")
+        assert isinstance(parsed_json, list), "Output JSON should be a list"
+        if parsed_json:
+            assert "issue_number" in parsed_json[0], "JSON objects should have 'issue_number'"
+            assert "labels_to_set" in parsed_json[0], "JSON objects should have 'labels_to_set'"